@@ -49,6 +49,8 @@ from .events import (
     EventBus,
     get_event_bus,
     emit,
+    emit_coalesced,
+    has_subscribers,
     subscribe,
     unsubscribe,
 )
@@ -112,6 +114,8 @@ from .storage import (
     DirectoryManager,
     TemporaryFileManager,
     DiskSpaceInfo,
+    PathInfo,
+    DirHandle,
 )
 
 # File I/O - Exporters
@@ -196,6 +200,8 @@ __all__ = [
     "EventBus",
     "get_event_bus",
     "emit",
+    "emit_coalesced",
+    "has_subscribers",
     "subscribe",
     "unsubscribe",
     # Commands
@@ -243,6 +249,8 @@ __all__ = [
     "DirectoryManager",
     "TemporaryFileManager",
     "DiskSpaceInfo",
+    "PathInfo",
+    "DirHandle",
     # Exporters
     "BaseExporter",
     "BatchExporter",
@@ -14,6 +14,7 @@ Features:
 """
 
 import threading
+import time
 import weakref
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -118,7 +119,8 @@ class EventHandler:
         callback: Callable[[Event], None],
         priority: EventPriority = EventPriority.NORMAL,
         filters: Optional[Dict[str, Any]] = None,
-        once: bool = False
+        once: bool = False,
+        coalesce: bool = False
     ):
         """
         Initialize event handler
@@ -128,6 +130,8 @@ class EventHandler:
             priority: Handler priority (lower executes first)
             filters: Optional filters (e.g., {'source_type': 'AppState'})
             once: If True, handler is removed after first execution
+            coalesce: If True, events sent with emit_coalesced() are
+                debounced and delivered as one merged event
         """
         # Use weak reference if callback is a method
         if hasattr(callback, '__self__'):
@@ -138,6 +142,7 @@ class EventHandler:
         self.priority = priority
         self.filters = filters or {}
         self.once = once
+        self.coalesce = coalesce
         self.call_count = 0
         self.last_called = None
 
@@ -206,6 +211,7 @@ class EventBus:
     - Priority-based handler execution
     - Event filtering
     - Batch event emission
+    - Coalesced (debounced) delivery for opt-in handlers
     - Thread-safe operations
     - Weak references to prevent memory leaks
 
@@ -224,6 +230,12 @@ class EventBus:
         self._event_queue: List[Event] = []
         self._batching = False
 
+        # Coalesced delivery (see emit_coalesced)
+        self._pending: Dict[Any, Event] = {}
+        self._deadlines: Dict[Any, float] = {}
+        self._coalesce_wakeup = threading.Condition(self._lock)
+        self._coalesce_worker: Optional[threading.Thread] = None
+
         # Statistics
         self._event_counts: Dict[EventType, int] = defaultdict(int)
         self._total_events = 0
@@ -234,7 +246,8 @@ class EventBus:
         callback: Callable[[Event], None],
         priority: EventPriority = EventPriority.NORMAL,
         filters: Optional[Dict[str, Any]] = None,
-        once: bool = False
+        once: bool = False,
+        coalesce: bool = False
     ) -> EventHandler:
         """
         Subscribe to an event type
@@ -245,12 +258,14 @@ class EventBus:
             priority: Handler priority
             filters: Optional filters
             once: Remove handler after first execution
+            coalesce: Receive emit_coalesced() events debounced and merged
+                (delivered from a worker thread)
 
         Returns:
             EventHandler that can be used to unsubscribe
         """
         with self._lock:
-            handler = EventHandler(callback, priority, filters, once)
+            handler = EventHandler(callback, priority, filters, once, coalesce)
             self._handlers[event_type].append(handler)
 
             # Sort by priority (lower priority number = higher priority)
@@ -332,25 +347,155 @@ class EventBus:
             self._event_counts[event.event_type] += 1
             self._total_events += 1
 
-            # Get handlers for this event type
+            self._dispatch(event)
+
+            logger.debug(f"Emitted event: {event}")
+
+    def emit_coalesced(
+        self,
+        event: Event,
+        key: Any = None,
+        debounce_ms: int = 16
+    ):
+        """
+        Emit an event, debouncing delivery to coalescing handlers
+
+        Regular handlers receive the event immediately, as with emit().
+        Handlers subscribed with coalesce=True receive a single event once
+        no further event with the same key has been emitted for debounce_ms;
+        its data is the merge of all the coalesced events' data.
+
+        Args:
+            event: Event to emit
+            key: Coalescing key (defaults to the event type)
+            debounce_ms: Quiet period before coalesced delivery
+        """
+        if not self._enabled:
+            return
+
+        with self._lock:
+            if self._batching:
+                self._event_queue.append(event)
+                return
+
+            self._event_counts[event.event_type] += 1
+            self._total_events += 1
+
+            self._dispatch(event, coalesced=False)
+
             handlers = self._handlers.get(event.event_type, [])
+            if not any(h.coalesce for h in handlers):
+                return
 
-            # Execute handlers and collect ones to remove
-            handlers_to_remove = []
+            if key is None:
+                key = event.event_type
+
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = Event(
+                    event.event_type,
+                    source=event.source,
+                    data=dict(event.data),
+                    timestamp=event.timestamp,
+                    priority=event.priority
+                )
+            else:
+                pending.data = {**pending.data, **event.data}
+                pending.timestamp = event.timestamp
+
+            # Restart the debounce window
+            self._deadlines[key] = time.monotonic() + debounce_ms / 1000.0
+
+            if self._coalesce_worker is None:
+                self._coalesce_worker = threading.Thread(
+                    target=self._run_coalesce_worker,
+                    name="event-coalesce",
+                    daemon=True
+                )
+                self._coalesce_worker.start()
+            else:
+                self._coalesce_wakeup.notify()
 
-            for handler in handlers[:]:  # Copy list to allow modification
-                should_keep = handler(event)
-                if not should_keep:
-                    handlers_to_remove.append(handler)
+    def _run_coalesce_worker(self):
+        """
+        Deliver coalesced events as their debounce windows close
 
-            # Remove handlers marked for removal
-            for handler in handlers_to_remove:
-                try:
-                    self._handlers[event.event_type].remove(handler)
-                except ValueError:
-                    pass
+        One worker serves every key and exits once nothing is pending;
+        the next emit_coalesced() starts a new one. Events are taken out
+        under the lock and delivered with it released, so handlers may
+        call back into objects that emit while holding their own locks.
+        """
+        while True:
+            with self._lock:
+                while True:
+                    if not self._deadlines:
+                        self._coalesce_worker = None
+                        return
+
+                    now = time.monotonic()
+                    due = [k for k, d in self._deadlines.items() if d <= now]
+                    if due:
+                        break
+
+                    self._coalesce_wakeup.wait(min(self._deadlines.values()) - now)
+
+                events = self._take_pending(due)
+
+            self._deliver_coalesced(events)
+
+    def _take_pending(self, keys: List[Any]) -> List[Event]:
+        """Remove and return the pending coalesced events for keys"""
+        for key in keys:
+            self._deadlines.pop(key, None)
+        return [self._pending.pop(key) for key in keys if key in self._pending]
+
+    def _deliver_coalesced(self, events: List[Event]):
+        """Run coalescing handlers for events taken with _take_pending"""
+        for event in events:
+            if self._enabled:
+                self._dispatch(event, coalesced=True)
+
+    def flush_coalesced(self):
+        """Immediately deliver all pending coalesced events on this thread"""
+        with self._lock:
+            events = self._take_pending(list(self._pending))
+            # Let the worker see there is nothing left to wait for
+            self._coalesce_wakeup.notify()
 
-            logger.debug(f"Emitted event: {event}")
+        self._deliver_coalesced(events)
+
+    def _dispatch(self, event: Event, coalesced: Optional[bool] = None):
+        """
+        Run handlers for an event
+
+        Args:
+            event: Event to deliver
+            coalesced: If set, only run handlers whose coalesce flag matches
+        """
+        # Get handlers for this event type (copy to allow modification)
+        with self._lock:
+            handlers = self._handlers.get(event.event_type, [])[:]
+
+        # Execute handlers and collect ones to remove. The lock is only
+        # held here if the caller already holds it.
+        handlers_to_remove = []
+
+        for handler in handlers:
+            if coalesced is not None and handler.coalesce != coalesced:
+                continue
+
+            should_keep = handler(event)
+            if not should_keep:
+                handlers_to_remove.append(handler)
+
+        # Remove handlers marked for removal
+        if handlers_to_remove:
+            with self._lock:
+                for handler in handlers_to_remove:
+                    try:
+                        self._handlers[event.event_type].remove(handler)
+                    except ValueError:
+                        pass
 
     def emit_async(self, event: Event):
         """
@@ -396,6 +541,18 @@ class EventBus:
         self._enabled = False
         logger.info("Event bus disabled")
 
+    def has_subscribers(self, event_type: EventType) -> bool:
+        """
+        Check whether any handler is subscribed to an event type
+
+        Lets emitters skip building events nobody will receive. While a
+        batch is open this is always True: queued events go to whoever is
+        subscribed when the batch ends, which may include handlers that
+        subscribe later.
+        """
+        with self._lock:
+            return self._batching or bool(self._handlers.get(event_type))
+
     def get_handler_count(self, event_type: Optional[EventType] = None) -> int:
         """Get number of handlers for an event type"""
         with self._lock:
@@ -440,15 +597,28 @@ def emit(event: Event):
     _event_bus.emit(event)
 
 
+def has_subscribers(event_type: EventType) -> bool:
+    """Convenience function to check for subscribers on the global bus"""
+    return _event_bus.has_subscribers(event_type)
+
+
+def emit_coalesced(event: Event, key: Any = None, debounce_ms: int = 16):
+    """Convenience function to emit a coalesced event on the global bus"""
+    _event_bus.emit_coalesced(event, key, debounce_ms)
+
+
 def subscribe(
     event_type: EventType,
     callback: Callable[[Event], None],
     priority: EventPriority = EventPriority.NORMAL,
     filters: Optional[Dict[str, Any]] = None,
-    once: bool = False
+    once: bool = False,
+    coalesce: bool = False
 ) -> EventHandler:
     """Convenience function to subscribe to the global bus"""
-    return _event_bus.subscribe(event_type, callback, priority, filters, once)
+    return _event_bus.subscribe(
+        event_type, callback, priority, filters, once, coalesce
+    )
 
 
 def unsubscribe(
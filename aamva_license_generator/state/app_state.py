@@ -19,7 +19,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import logging
 
-from ..events import Event, EventType, emit
+from ..events import Event, EventType, emit, emit_coalesced, has_subscribers
 from ..commands import Command, FunctionCommand, get_command_history
 from .generation_state import GenerationState
 from .history_manager import HistoryEntry, get_history_manager
@@ -721,26 +721,36 @@ class AppState:
         self._schedule_auto_save()
 
     def _schedule_auto_save(self):
-        """Schedule automatic save"""
+        """
+        Schedule automatic save
+
+        Every setter marks the state dirty, so a pending save is reused
+        rather than cancelled and replaced with a new timer thread on each
+        write. Changes are saved at most auto_save_interval after the first
+        unsaved change.
+        """
         if not self._auto_save_enabled:
             return
 
-        # Cancel existing timer
-        if self._auto_save_timer:
-            self._auto_save_timer.cancel()
+        with self._lock:
+            # A save is already pending and will pick up this change
+            if self._auto_save_timer is not None:
+                return
 
-        # Schedule new save
-        self._auto_save_timer = threading.Timer(
-            self.settings.advanced.auto_save_interval,
-            self._auto_save_callback
-        )
-        self._auto_save_timer.daemon = True
-        self._auto_save_timer.start()
+            self._auto_save_timer = threading.Timer(
+                self.settings.advanced.auto_save_interval,
+                self._auto_save_callback
+            )
+            self._auto_save_timer.daemon = True
+            self._auto_save_timer.start()
 
     def _auto_save_callback(self):
         """Auto-save callback"""
-        if self._dirty:
-            self.save()
+        with self._lock:
+            self._auto_save_timer = None
+
+            if self._dirty:
+                self.save()
 
     def enable_auto_save(self):
         """Enable automatic saving"""
@@ -749,14 +759,19 @@ class AppState:
     def disable_auto_save(self):
         """Disable automatic saving"""
         self._auto_save_enabled = False
-        if self._auto_save_timer:
-            self._auto_save_timer.cancel()
+        with self._lock:
+            if self._auto_save_timer:
+                self._auto_save_timer.cancel()
+                self._auto_save_timer = None
 
     # Change notification
 
     def _notify_change(self, field: str, value: Any):
-        """Notify about state change"""
-        emit(Event(
+        """Notify about state change (coalesced for opt-in subscribers)"""
+        if not has_subscribers(EventType.STATE_CHANGED):
+            return
+
+        emit_coalesced(Event(
             EventType.STATE_CHANGED,
             source=self,
             data={'field': field, 'value': value}
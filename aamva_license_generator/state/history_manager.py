@@ -16,8 +16,9 @@ import threading
 from collections import deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterable, List, Optional
 import logging
 
 from ..events import Event, EventType, emit
@@ -176,7 +177,11 @@ class HistoryManager:
         """
         with self._lock:
             try:
-                self._history.append(entry)
+                if self._history and entry.timestamp < self._history[-1].timestamp:
+                    # Out-of-order entry: insert in chronological position
+                    self._insert_entry(entry)
+                else:
+                    self._history.append(entry)
 
                 # Auto-save
                 if self._auto_save_enabled:
@@ -201,6 +206,31 @@ class HistoryManager:
                 logger.error(f"Failed to add history entry: {e}", exc_info=True)
                 return False
 
+    def _insert_entry(self, entry: HistoryEntry):
+        """
+        Insert an entry older than the newest one, keeping chronological order
+
+        Finds the position by binary search (after any entries with the same
+        timestamp). When the history is full the oldest entry is dropped, so
+        an entry older than everything kept is not inserted at all.
+        """
+        history = self._history
+        lo, hi = 0, len(history)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if entry.timestamp < history[mid].timestamp:
+                hi = mid
+            else:
+                lo = mid + 1
+
+        if len(history) == history.maxlen:
+            if lo == 0:
+                return
+            history.popleft()
+            lo -= 1
+
+        history.insert(lo, entry)
+
     def get_entries(
         self,
         limit: Optional[int] = None,
@@ -221,26 +251,35 @@ class HistoryManager:
             List of matching history entries
         """
         with self._lock:
-            entries = list(self._history)
+            # History is kept in chronological order, so newest first is a
+            # reverse walk that can stop as soon as the limit is reached
+            entries: Iterable[HistoryEntry] = reversed(self._history)
 
             # Apply filters
             if state_code:
-                entries = [e for e in entries if e.state_code == state_code]
+                entries = (e for e in entries if e.state_code == state_code)
 
             if success_only:
-                entries = [e for e in entries if e.success]
+                entries = (e for e in entries if e.success)
 
             if since:
-                entries = [e for e in entries if e.timestamp >= since]
-
-            # Sort by timestamp (newest first)
-            entries.sort(key=lambda e: e.timestamp, reverse=True)
+                entries = (e for e in entries if e.timestamp >= since)
 
             # Apply limit
             if limit:
-                entries = entries[:limit]
+                return list(islice(entries, limit))
+
+            return list(entries)
 
-            return entries
+    @staticmethod
+    def _parse_entries(data: Dict[str, Any]) -> List[HistoryEntry]:
+        """Parse serialized entries into chronological order"""
+        entries = [
+            HistoryEntry.from_dict(entry_data)
+            for entry_data in data.get('entries', [])
+        ]
+        entries.sort(key=lambda e: e.timestamp)
+        return entries
 
     def get_latest(self) -> Optional[HistoryEntry]:
         """Get most recent history entry"""
@@ -405,10 +444,8 @@ class HistoryManager:
                 # Clear existing history
                 self._history.clear()
 
-                # Load entries
-                for entry_data in data.get('entries', []):
-                    entry = HistoryEntry.from_dict(entry_data)
-                    self._history.append(entry)
+                # Load entries (oldest first, see get_entries)
+                self._history.extend(self._parse_entries(data))
 
                 emit(Event(
                     EventType.HISTORY_LOADED,
@@ -495,10 +532,8 @@ class HistoryManager:
                 # Clear existing history
                 self._history.clear()
 
-                # Load entries
-                for entry_data in data.get('entries', []):
-                    entry = HistoryEntry.from_dict(entry_data)
-                    self._history.append(entry)
+                # Load entries (oldest first, see get_entries)
+                self._history.extend(self._parse_entries(data))
 
                 # Save imported history
                 self.save()
@@ -20,7 +20,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 import logging
 
-from ..events import Event, EventType, emit
+from ..events import Event, EventType, emit, has_subscribers
 
 logger = logging.getLogger(__name__)
 
@@ -240,7 +240,8 @@ class Settings:
 
             self.save()
 
-            emit(Event(EventType.SETTINGS_CHANGED, source=self))
+            if has_subscribers(EventType.SETTINGS_CHANGED):
+                emit(Event(EventType.SETTINGS_CHANGED, source=self))
             logger.info("Settings reset to defaults")
 
     # Window settings helpers
@@ -342,7 +343,8 @@ class Settings:
 
     def notify_changed(self):
         """Notify that settings have changed"""
-        emit(Event(EventType.SETTINGS_CHANGED, source=self))
+        if has_subscribers(EventType.SETTINGS_CHANGED):
+            emit(Event(EventType.SETTINGS_CHANGED, source=self))
         self._schedule_auto_save()
 
     # Auto-save control
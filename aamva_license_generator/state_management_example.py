@@ -13,6 +13,7 @@ Demonstrates all features of the state management system:
 """
 
 import time
+import traceback
 from datetime import datetime
 
 from aamva_license_generator.events import (
@@ -329,9 +330,15 @@ def example_7_generation_tracking():
     print(f"   Status: {gen_state.status.name}")
     print(f"   Total count: {gen_state.total_count}")
 
+    # Precompute per-license results outside the processing loop
+    count = 10
+    name = "John Doe"
+    license_numbers = [f"CA{12345678 + i}" for i in range(count)]
+    license_files = [[f"/tmp/license_{i}.bmp"] for i in range(count)]
+
     # Simulate processing licenses
     print("\n2. Processing licenses...")
-    for i in range(10):
+    for i in range(count):
         # Start license
         gen_state.start_license(i, state_code="CA")
         print(f"   Processing license #{i+1}...")
@@ -340,12 +347,12 @@ def example_7_generation_tracking():
         time.sleep(0.1)
 
         # Complete license (90% success rate for demo)
-        if i < 9:
+        if i < count - 1:
             gen_state.complete_license(
                 i,
-                license_number=f"CA{12345678 + i}",
-                name="John Doe",
-                files=[f"/tmp/license_{i}.bmp"]
+                license_number=license_numbers[i],
+                name=name,
+                files=license_files[i]
             )
             print(f"     ✓ Completed")
         else:
@@ -534,6 +541,15 @@ def example_10_thread_safety():
     print(f"   Final state: {state.config}")
 
 
+def _run_example(name, example_func):
+    """Run one example, reporting (not raising) any failure"""
+    try:
+        example_func()
+    except Exception as e:
+        print(f"\n❌ Example '{name}' failed: {e}")
+        traceback.print_exc()
+
+
 def main():
     """Run all examples"""
     print("\n" + "=" * 60)
@@ -560,13 +576,7 @@ def main():
     print("\nRunning all examples...\n")
 
     for name, example_func in examples:
-        try:
-            example_func()
-            time.sleep(0.5)  # Pause between examples
-        except Exception as e:
-            print(f"\n❌ Example '{name}' failed: {e}")
-            import traceback
-            traceback.print_exc()
+        _run_example(name, example_func)
 
     print("\n" + "=" * 60)
     print("ALL EXAMPLES COMPLETED!")
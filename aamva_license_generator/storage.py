@@ -10,15 +10,229 @@ This module provides robust file system operations with:
 - Context managers for resource safety
 """
 
+import errno
+import fnmatch
+import io
+import mmap
 import os
+import re
+import secrets
 import shutil
+import stat
+import sys
 import tempfile
+import threading
+import time
 import hashlib
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Union, BinaryIO, TextIO, Callable
+from typing import Optional, Union, BinaryIO, TextIO, Callable, Dict, List, Tuple
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+logger = logging.getLogger(__name__)
+
+
+# Read size for checksum fallback loops (large blocks amortize syscalls)
+CHECKSUM_CHUNK_SIZE = 1 << 20
+
+# Files are hashed from memory maps in windows of this size; completed
+# windows of large files are dropped from memory as hashing moves on
+MMAP_WINDOW_SIZE = 256 << 20
+
+# Copies with progress reporting move data in slices of this size, and
+# report progress after each slice
+COPY_SLICE_SIZE = 16 << 20
+
+# In-kernel copies of large files grow their slices so that no copy takes
+# more than this many calls (progress is still reported per slice)
+COPY_MAX_KERNEL_CALLS = 32
+
+# Largest count a single copy_file_range()/sendfile() call will move on
+# Linux (MAX_RW_COUNT)
+_MAX_KERNEL_COPY_COUNT = 0x7ffff000
+
+# Binary chunked reads at least this large bypass the read buffer
+UNBUFFERED_READ_MIN_CHUNK = 64 << 10
+
+# atomic_write preallocates temp files whose expected size is at least this
+PREALLOCATE_MIN_SIZE = 1 << 20
+
+# atomic_write can create unnamed O_TMPFILE temp files and link them in
+# through /proc (Linux)
+ANONYMOUS_TEMP_SUPPORTED = hasattr(os, 'O_TMPFILE') and os.path.isdir('/proc/self/fd')
+
+# RAM-backed directory for scratch files (Linux)
+TMPFS_DIR = '/dev/shm'
+
+# Disk usage figures are reused for this many seconds per device
+DISK_SPACE_CACHE_TTL = 1.0
+
+# Device id -> (monotonic time fetched, DiskSpaceInfo)
+_disk_space_cache: Dict[int, Tuple[float, 'DiskSpaceInfo']] = {}
+
+# Default thread count for overlapping unlink/stat calls in directory
+# operations (latency-bound on network filesystems)
+IO_WORKERS = 8
+
+# Background threads for calculate_checksum_async (hashing releases the
+# GIL, so a few checksums can run alongside the caller)
+CHECKSUM_WORKERS = min(4, os.cpu_count() or 1)
+
+_checksum_executor: Optional[ThreadPoolExecutor] = None
+_checksum_executor_lock = threading.Lock()
+
+# safe_cleanup only uses worker threads for at least this many files
+PARALLEL_CLEANUP_MIN_FILES = 64
+
+# Errors meaning "this copy mechanism is unsupported here", not "the copy
+# failed"; on these, copies fall back to the next mechanism
+_COPY_FALLBACK_ERRNOS = frozenset({
+    errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EBADF,
+    errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+})
+
+
+def _kernel_copy_functions():
+    """In-kernel fd-to-fd copy functions available on this platform"""
+    functions = []
+    if hasattr(os, 'copy_file_range'):  # Linux, Python 3.8+
+        functions.append(
+            lambda src_fd, dst_fd, count: os.copy_file_range(src_fd, dst_fd, count)
+        )
+    if sys.platform.startswith('linux'):  # sendfile() to regular files
+        functions.append(
+            lambda src_fd, dst_fd, count: os.sendfile(dst_fd, src_fd, None, count)
+        )
+    return tuple(functions)
+
+
+_KERNEL_COPY_FUNCTIONS = _kernel_copy_functions()
+
+
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str):
+    """Compile a single-component glob pattern to a regex matcher"""
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+@lru_cache(maxsize=4096)
+def _validate_path_cached(path_str: str, cwd: Optional[str]) -> Path:
+    """
+    Resolve and check a path, memoized per (path, working directory)
+
+    Relative paths are keyed on the working directory they were resolved
+    against. Existence is not cached; callers check it on every call.
+    """
+    try:
+        path_obj = Path(path_str).resolve()
+    except (ValueError, OSError) as e:
+        raise PathError(f"Invalid path '{path_str}': {e}")
+
+    # Check for invalid characters (platform-specific)
+    resolved_str = str(path_obj)
+    if '\x00' in resolved_str:
+        raise PathError(f"Path contains null character: {path_str}")
+
+    # Check path length (Windows limitation)
+    if len(resolved_str) > 260 and os.name == 'nt':
+        raise PathError(f"Path too long (>{260} chars): {path_str}")
+
+    return path_obj
+
+
+def _get_checksum_executor() -> ThreadPoolExecutor:
+    """Get the shared checksum thread pool, starting it on first use"""
+    global _checksum_executor
+    with _checksum_executor_lock:
+        if _checksum_executor is None:
+            _checksum_executor = ThreadPoolExecutor(
+                max_workers=CHECKSUM_WORKERS,
+                thread_name_prefix="aamva-checksum",
+            )
+        return _checksum_executor
+
+
+@lru_cache(maxsize=1)
+def _usable_tmpfs_dir() -> Optional[str]:
+    """TMPFS_DIR if it exists and we can create files in it"""
+    if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK | os.X_OK):
+        return TMPFS_DIR
+    return None
+
+
+def _temp_parent(prefer_tmpfs: bool,
+                 destination: Optional[Union[str, Path]]) -> Optional[str]:
+    """
+    Choose the directory to create a temporary file or directory in
+
+    tmpfs is used when preferred and available, unless TMPDIR is set (the
+    user chose where temporary files go) or the result is to be renamed
+    into a destination on another filesystem (rename cannot cross
+    filesystems); then the destination directory is used. None means the
+    tempfile default.
+    """
+    tmpfs_dir = None
+    if prefer_tmpfs and not os.environ.get('TMPDIR'):
+        tmpfs_dir = _usable_tmpfs_dir()
+
+    if destination is None:
+        return tmpfs_dir
+
+    if tmpfs_dir is not None:
+        try:
+            if os.stat(tmpfs_dir).st_dev == os.stat(destination).st_dev:
+                return tmpfs_dir
+        except OSError:
+            pass
+
+    return os.fspath(destination)
+
+
+# Direct hashlib constructors for common algorithms; these skip the
+# name lookup that hashlib.new() does on every call
+_HASH_CTORS: Dict[str, Callable] = {
+    'sha256': hashlib.sha256,
+    'sha1': hashlib.sha1,
+    'md5': hashlib.md5,
+    'blake2b': hashlib.blake2b,
+}
+
+
+def _new_hasher(algorithm: str):
+    """Create a hash object for algorithm"""
+    ctor = _HASH_CTORS.get(algorithm)
+    return ctor() if ctor is not None else hashlib.new(algorithm)
+
+
+def _fadvise(fd: int, advice: Optional[int]) -> None:
+    """Give the kernel a whole-file access hint, where supported"""
+    if advice is None or not hasattr(os, 'posix_fadvise'):
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass  # Advisory only
+
+
+# posix_fadvise hints (None where unavailable, e.g. Windows and macOS)
+_FADV_SEQUENTIAL = getattr(os, 'POSIX_FADV_SEQUENTIAL', None)
+_FADV_DONTNEED = getattr(os, 'POSIX_FADV_DONTNEED', None)
+
+
+def _write_all(fd: int, data) -> None:
+    """Write all of data to a raw file descriptor"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 class StorageError(Exception):
@@ -77,14 +291,70 @@ class DiskSpaceInfo:
         return self.free / (1024 * 1024 * 1024)
 
 
+@dataclass
+class PathInfo:
+    """Result of probing a path with a single stat() and access() check"""
+    exists: bool
+    is_dir: bool = False
+    is_file: bool = False
+    readable: bool = False
+    writable: bool = False
+    size: int = 0       # Size in bytes
+    mtime: float = 0.0  # Modification time (epoch seconds)
+
+
+@dataclass
+class DirHandle:
+    """An open, validated directory for repeated writes (see open_dir)"""
+    path: Path          # Resolved directory path
+    fd: Optional[int]   # Directory descriptor, or None without dir fd support
+
+
 class FileSystemValidator:
     """Validates file system operations before execution"""
 
+    @staticmethod
+    def inspect(path: Union[str, Path]) -> PathInfo:
+        """
+        Probe a path once instead of issuing separate exists/is_dir/access
+        checks
+
+        Args:
+            path: Path to inspect
+
+        Returns:
+            PathInfo describing the path
+        """
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return PathInfo(exists=False)
+
+        # One access() call covers the common read-write case
+        if os.access(path, os.R_OK | os.W_OK):
+            readable = writable = True
+        else:
+            readable = os.access(path, os.R_OK)
+            writable = os.access(path, os.W_OK)
+
+        return PathInfo(
+            exists=True,
+            is_dir=stat.S_ISDIR(st.st_mode),
+            is_file=stat.S_ISREG(st.st_mode),
+            readable=readable,
+            writable=writable,
+            size=st.st_size,
+            mtime=st.st_mtime
+        )
+
     @staticmethod
     def validate_path(path: Union[str, Path], must_exist: bool = False) -> Path:
         """
         Validate a file system path
 
+        Resolved paths are cached; call clear_validation_cache() after
+        replacing directories or symlinks along a validated path.
+
         Args:
             path: Path to validate
             must_exist: If True, path must already exist
@@ -95,25 +365,20 @@ class FileSystemValidator:
         Raises:
             PathError: If path is invalid
         """
-        try:
-            path_obj = Path(path).resolve()
-        except (ValueError, OSError) as e:
-            raise PathError(f"Invalid path '{path}': {e}")
-
-        # Check for invalid characters (platform-specific)
-        path_str = str(path_obj)
-        if '\x00' in path_str:
-            raise PathError(f"Path contains null character: {path}")
-
-        # Check path length (Windows limitation)
-        if len(path_str) > 260 and os.name == 'nt':
-            raise PathError(f"Path too long (>{260} chars): {path}")
+        path_str = os.fspath(path)
+        cwd = None if os.path.isabs(path_str) else os.getcwd()
+        path_obj = _validate_path_cached(path_str, cwd)
 
         if must_exist and not path_obj.exists():
             raise PathError(f"Path does not exist: {path}")
 
         return path_obj
 
+    @staticmethod
+    def clear_validation_cache() -> None:
+        """Forget paths resolved by validate_path"""
+        _validate_path_cached.cache_clear()
+
     @staticmethod
     def check_writable(path: Union[str, Path]) -> bool:
         """
@@ -150,31 +415,71 @@ class FileSystemValidator:
         return path_obj.exists() and os.access(path_obj, os.R_OK)
 
     @staticmethod
-    def get_disk_space(path: Union[str, Path]) -> DiskSpaceInfo:
+    def get_disk_space(path: Union[str, Path],
+                       max_age: float = DISK_SPACE_CACHE_TTL) -> DiskSpaceInfo:
         """
         Get disk space information for a path
 
+        Results are cached per filesystem for max_age seconds, so batch
+        writes do not each pay for a statvfs() call.
+
         Args:
             path: Path to check
+            max_age: Maximum age in seconds of a cached result (0 to refresh)
 
         Returns:
             DiskSpaceInfo object with disk usage details
         """
         path_obj = Path(path)
 
-        # Get parent if file doesn't exist
-        check_path = path_obj if path_obj.exists() else path_obj.parent
-
         try:
-            stat = shutil.disk_usage(check_path)
-            return DiskSpaceInfo(
-                total=stat.total,
-                used=stat.used,
-                free=stat.free
+            # Get parent if file doesn't exist
+            try:
+                check_path = path_obj
+                device = os.stat(check_path).st_dev
+            except FileNotFoundError:
+                check_path = path_obj.parent
+                device = os.stat(check_path).st_dev
+
+            now = time.monotonic()
+            cached = _disk_space_cache.get(device)
+            if cached and now - cached[0] < max_age:
+                return cached[1]
+
+            usage = shutil.disk_usage(check_path)
+            space = DiskSpaceInfo(
+                total=usage.total,
+                used=usage.used,
+                free=usage.free
             )
+            _disk_space_cache[device] = (now, space)
+            return space
         except OSError as e:
             raise StorageError(f"Could not get disk space for {path}: {e}")
 
+    @staticmethod
+    def notify_write(path: Union[str, Path], bytes_written: int) -> None:
+        """
+        Account for a write in the cached disk space of a path's filesystem
+
+        Args:
+            path: Path that was written
+            bytes_written: Number of bytes written
+        """
+        try:
+            device = os.stat(path).st_dev
+        except OSError:
+            return
+
+        cached = _disk_space_cache.get(device)
+        if cached:
+            fetched_at, space = cached
+            _disk_space_cache[device] = (fetched_at, DiskSpaceInfo(
+                total=space.total,
+                used=space.used + bytes_written,
+                free=max(space.free - bytes_written, 0)
+            ))
+
     @staticmethod
     def ensure_space(path: Union[str, Path], required_bytes: int,
                      buffer_percent: float = 10.0) -> None:
@@ -192,6 +497,10 @@ class FileSystemValidator:
         space = FileSystemValidator.get_disk_space(path)
         required_with_buffer = required_bytes * (1 + buffer_percent / 100)
 
+        if space.free < required_with_buffer:
+            # Never fail on a cached figure; re-check the real free space
+            space = FileSystemValidator.get_disk_space(path, max_age=0)
+
         if space.free < required_with_buffer:
             raise DiskSpaceError(
                 f"Insufficient disk space. Required: {required_with_buffer / (1024**2):.1f} MB, "
@@ -206,7 +515,8 @@ class SafeFileOperations:
     @contextmanager
     def atomic_write(filepath: Union[str, Path], mode: str = 'w',
                      encoding: Optional[str] = 'utf-8',
-                     verify_checksum: bool = False):
+                     verify_checksum: bool = False,
+                     expected_size: Optional[int] = None):
         """
         Atomic file write using temporary file
 
@@ -214,11 +524,21 @@ class SafeFileOperations:
         the final location. This ensures the target file is never corrupted
         if the write fails partway through.
 
+        On Linux the temporary file is an unnamed O_TMPFILE inode: it is
+        never visible in the directory while being written, and nothing is
+        left behind if the write fails or the process dies.
+
+        When expected_size is given, disk space is checked up front and
+        large temp files are preallocated in one step instead of growing
+        block by block. The file is truncated at the final write position,
+        so writes are expected to be sequential.
+
         Args:
             filepath: Destination file path
             mode: File mode ('w' or 'wb')
             encoding: Text encoding (for text mode)
             verify_checksum: If True, verify file after write
+            expected_size: Approximate size of the data in bytes (optional)
 
         Yields:
             File handle for writing
@@ -230,29 +550,55 @@ class SafeFileOperations:
         filepath = FileSystemValidator.validate_path(filepath)
 
         # Check writable before starting
-        if not FileSystemValidator.check_writable(filepath.parent):
+        parent_info = FileSystemValidator.inspect(filepath.parent)
+        if parent_info.exists:
+            parent_writable = parent_info.writable
+        else:
+            parent_writable = FileSystemValidator.check_writable(filepath.parent)
+
+        if not parent_writable:
             raise PermissionError(f"Cannot write to directory: {filepath.parent}")
 
+        if expected_size:
+            FileSystemValidator.ensure_space(filepath.parent, expected_size)
+
         # Create temporary file in same directory
         # (ensures same filesystem for atomic rename)
-        temp_fd, temp_path = tempfile.mkstemp(
-            dir=filepath.parent,
-            prefix=f".tmp_{filepath.name}_"
-        )
-
-        temp_path_obj = Path(temp_path)
+        temp_path_obj: Optional[Path] = None
+        temp_fd = None
+        if not verify_checksum:  # Verification re-reads the temp file by name
+            temp_fd = SafeFileOperations._open_anonymous_temp(filepath.parent)
+
+        anonymous = temp_fd is not None
+        if not anonymous:
+            temp_fd, temp_path = tempfile.mkstemp(
+                dir=filepath.parent,
+                prefix=f".tmp_{filepath.name}_"
+            )
+            temp_path_obj = Path(temp_path)
 
         try:
-            # Close the file descriptor, we'll open properly
-            os.close(temp_fd)
-
-            # Open temp file with requested mode
-            if 'b' in mode:
-                with open(temp_path_obj, mode) as f:
-                    yield f
-            else:
-                with open(temp_path_obj, mode, encoding=encoding) as f:
-                    yield f
+            # Wrap the descriptor rather than reopening the temp file by
+            # name, which would truncate away any preallocated space
+            try:
+                preallocated = SafeFileOperations._preallocate(temp_fd, expected_size)
+                if 'b' in mode:
+                    f = os.fdopen(temp_fd, mode)
+                else:
+                    f = os.fdopen(temp_fd, mode, encoding=encoding)
+            except Exception:
+                os.close(temp_fd)
+                raise
+
+            with f:
+                yield f
+                if preallocated:
+                    f.truncate()  # Release unused preallocated space
+                if anonymous:
+                    f.flush()
+                    temp_path_obj = SafeFileOperations._link_anonymous_temp(
+                        f.fileno(), filepath
+                    )
 
             # Verify checksum if requested
             if verify_checksum and filepath.exists():
@@ -263,18 +609,242 @@ class SafeFileOperations:
                         f"Checksum mismatch after write: {filepath}"
                     )
 
-            # Atomic rename (overwrites destination)
-            temp_path_obj.replace(filepath)
+            # Atomic rename (overwrites destination); an anonymous temp
+            # file linked straight in as the destination needs no rename
+            if temp_path_obj is not None:
+                temp_path_obj.replace(filepath)
+
+            if expected_size:
+                FileSystemValidator.notify_write(filepath, expected_size)
 
         except Exception as e:
             # Clean up temp file on error
             try:
-                if temp_path_obj.exists():
+                if temp_path_obj is not None and temp_path_obj.exists():
                     temp_path_obj.unlink()
             except Exception:
                 pass  # Best effort cleanup
             raise StorageError(f"Failed to write {filepath}: {e}") from e
 
+    @staticmethod
+    def _open_anonymous_temp(directory: Union[str, Path],
+                             dir_fd: Optional[int] = None) -> Optional[int]:
+        """
+        Open an unnamed O_TMPFILE temp file in a directory
+
+        directory is taken relative to dir_fd when one is given.
+
+        Returns:
+            File descriptor, or None if unsupported here
+        """
+        if not ANONYMOUS_TEMP_SUPPORTED:
+            return None
+
+        try:
+            return os.open(directory, os.O_TMPFILE | os.O_RDWR, 0o600,
+                           dir_fd=dir_fd)
+        except OSError:
+            return None  # Filesystem without O_TMPFILE support
+
+    @staticmethod
+    def _link_anonymous_temp(fd: int, filepath: Path) -> Optional[Path]:
+        """
+        Give an O_TMPFILE inode a name
+
+        A new destination is linked in directly. An existing one cannot be
+        replaced by link(), so the inode is linked under a temporary name
+        instead, to be renamed over the destination.
+
+        Returns:
+            Temporary path to rename, or None if linked as filepath
+        """
+        dir_fd = os.open(filepath.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            temp_name = SafeFileOperations._link_anonymous_temp_at(
+                fd, dir_fd, filepath.name
+            )
+        finally:
+            os.close(dir_fd)
+
+        return None if temp_name is None else filepath.parent / temp_name
+
+    @staticmethod
+    def _link_anonymous_temp_at(fd: int, dir_fd: int, name: str) -> Optional[str]:
+        """
+        Give an O_TMPFILE inode a name in the directory open as dir_fd
+
+        Returns:
+            Temporary name to rename, or None if linked as name
+        """
+        fd_path = f"/proc/self/fd/{fd}"
+
+        # The /proc link must be followed to reach the inode; os.link()
+        # only uses linkat() with AT_SYMLINK_FOLLOW when given a dir fd
+        try:
+            os.link(fd_path, name, dst_dir_fd=dir_fd)
+            return None
+        except FileExistsError:
+            pass
+
+        temp_name = f".tmp_{name}_{secrets.token_hex(8)}"
+        os.link(fd_path, temp_name, dst_dir_fd=dir_fd)
+        return temp_name
+
+    @staticmethod
+    @contextmanager
+    def open_dir(path: Union[str, Path]):
+        """
+        Open a directory once for a batch of atomic_write_at() calls
+
+        The directory is resolved and checked for writability here, once,
+        instead of on every write. Writes go through the open descriptor,
+        so they keep targeting the same directory even if it is renamed.
+
+        Args:
+            path: Existing directory to write into
+
+        Yields:
+            DirHandle for atomic_write_at()
+
+        Raises:
+            PathError: If path doesn't exist or is not a directory
+            PermissionError: If the directory is not writable
+        """
+        dir_path = FileSystemValidator.validate_path(path, must_exist=True)
+
+        info = FileSystemValidator.inspect(dir_path)
+        if not info.is_dir:
+            raise PathError(f"Not a directory: {path}")
+        if not info.writable:
+            raise PermissionError(f"Cannot write to directory: {dir_path}")
+
+        dir_fd = None
+        if os.open in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY'):
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+
+        try:
+            yield DirHandle(path=dir_path, fd=dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+
+    @staticmethod
+    @contextmanager
+    def atomic_write_at(directory: DirHandle, filename: str, mode: str = 'w',
+                        encoding: Optional[str] = 'utf-8',
+                        expected_size: Optional[int] = None):
+        """
+        Atomic file write into a directory opened with open_dir()
+
+        Behaves like atomic_write(), but the temp file is created, linked
+        and renamed relative to the directory descriptor, without
+        resolving or checking the directory again.
+
+        Args:
+            directory: Handle from open_dir()
+            filename: Name of the file within the directory
+            mode: File mode ('w' or 'wb')
+            encoding: Text encoding (for text mode)
+            expected_size: Approximate size of the data in bytes (optional)
+
+        Yields:
+            File handle for writing
+
+        Raises:
+            PathError: If filename is not a plain file name
+
+        Example:
+            with SafeFileOperations.open_dir('output') as out:
+                for name, text in files:
+                    with SafeFileOperations.atomic_write_at(out, name) as f:
+                        f.write(text)
+        """
+        if (not filename or filename in ('.', '..') or '\x00' in filename
+                or '/' in filename or os.sep in filename):
+            raise PathError(f"Not a plain file name: {filename!r}")
+
+        if directory.fd is None:
+            with SafeFileOperations.atomic_write(
+                directory.path / filename, mode, encoding,
+                expected_size=expected_size
+            ) as f:
+                yield f
+            return
+
+        dir_fd = directory.fd
+        filepath = directory.path / filename
+
+        if expected_size:
+            FileSystemValidator.ensure_space(directory.path, expected_size)
+
+        temp_name: Optional[str] = None
+        temp_fd = SafeFileOperations._open_anonymous_temp('.', dir_fd=dir_fd)
+
+        anonymous = temp_fd is not None
+        if not anonymous:
+            temp_name = f".tmp_{filename}_{secrets.token_hex(8)}"
+            temp_fd = os.open(temp_name, os.O_RDWR | os.O_CREAT | os.O_EXCL,
+                              0o600, dir_fd=dir_fd)
+
+        try:
+            try:
+                preallocated = SafeFileOperations._preallocate(temp_fd, expected_size)
+                if 'b' in mode:
+                    f = os.fdopen(temp_fd, mode)
+                else:
+                    f = os.fdopen(temp_fd, mode, encoding=encoding)
+            except Exception:
+                os.close(temp_fd)
+                raise
+
+            with f:
+                yield f
+                if preallocated:
+                    f.truncate()  # Release unused preallocated space
+                if anonymous:
+                    f.flush()
+                    temp_name = SafeFileOperations._link_anonymous_temp_at(
+                        f.fileno(), dir_fd, filename
+                    )
+
+            if temp_name is not None:
+                os.replace(temp_name, filename,
+                           src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+            if expected_size:
+                FileSystemValidator.notify_write(filepath, expected_size)
+
+        except Exception as e:
+            # Clean up temp file on error
+            try:
+                if temp_name is not None:
+                    os.unlink(temp_name, dir_fd=dir_fd)
+            except OSError:
+                pass  # Best effort cleanup
+            raise StorageError(f"Failed to write {filepath}: {e}") from e
+
+    @staticmethod
+    def _preallocate(fd: int, expected_size: Optional[int]) -> bool:
+        """
+        Preallocate a file's blocks if it is expected to be large
+
+        Returns:
+            True if space was preallocated
+        """
+        if (not expected_size or expected_size < PREALLOCATE_MIN_SIZE
+                or not hasattr(os, 'posix_fallocate')):
+            return False
+
+        try:
+            os.posix_fallocate(fd, 0, expected_size)
+            return True
+        except OSError as e:
+            if e.errno == errno.ENOSPC:
+                raise DiskSpaceError(
+                    f"Insufficient disk space for {expected_size} bytes"
+                ) from e
+            return False  # Not supported by this filesystem
+
     @staticmethod
     def safe_read(filepath: Union[str, Path], mode: str = 'r',
                   encoding: Optional[str] = 'utf-8',
@@ -286,7 +856,8 @@ class SafeFileOperations:
             filepath: File to read
             mode: Read mode ('r' or 'rb')
             encoding: Text encoding (for text mode)
-            chunk_size: If provided, read in chunks (for large files)
+            chunk_size: If provided, read in chunks of this many bytes or
+                characters (for large files; around 1 MiB works well)
 
         Returns:
             File contents or generator of chunks
@@ -319,13 +890,21 @@ class SafeFileOperations:
     @staticmethod
     def _read_chunks(filepath: Path, mode: str, encoding: Optional[str],
                      chunk_size: int):
-        """Generator for reading file in chunks"""
+        """
+        Generator for reading file in chunks
+
+        Large binary chunks are read straight from the raw file (a read
+        buffer would only add a copy); text reads get a buffer sized to
+        the chunk instead of the 8 KiB default.
+        """
         if 'b' in mode:
-            with open(filepath, mode) as f:
+            buffering = 0 if chunk_size >= UNBUFFERED_READ_MIN_CHUNK else -1
+            with open(filepath, mode, buffering=buffering) as f:
                 while chunk := f.read(chunk_size):
                     yield chunk
         else:
-            with open(filepath, mode, encoding=encoding) as f:
+            with open(filepath, mode, encoding=encoding,
+                      buffering=max(chunk_size, io.DEFAULT_BUFFER_SIZE)) as f:
                 while chunk := f.read(chunk_size):
                     yield chunk
 
@@ -335,20 +914,177 @@ class SafeFileOperations:
         """
         Calculate file checksum
 
+        Regular files are memory-mapped and hashed straight from the page
+        cache without copying into Python buffers. Other files use
+        hashlib.file_digest() where available (Python 3.11+), which hashes
+        in C without a Python-level read loop. The file's pages are dropped
+        from the page cache afterwards so hashing does not evict hot data.
+
         Args:
             filepath: File to checksum
-            algorithm: Hash algorithm ('md5', 'sha1', 'sha256', etc.)
+            algorithm: Hash algorithm ('md5', 'sha1', 'sha256', etc.), or
+                'blake3' if the optional blake3 package is installed
 
         Returns:
             Hexadecimal checksum string
         """
         filepath = FileSystemValidator.validate_path(filepath, must_exist=True)
 
-        hasher = hashlib.new(algorithm)
+        if algorithm == 'blake3':
+            if blake3 is None:
+                raise StorageError(
+                    "blake3 checksums require the blake3 package. "
+                    "Install with: pip install blake3"
+                )
+            hasher = blake3.blake3(max_threads=blake3.blake3.AUTO)
+            hasher.update_mmap(filepath)
+            return hasher.hexdigest()
+
+        with open(filepath, 'rb', buffering=0) as f:
+            fd = f.fileno()
+            _fadvise(fd, _FADV_SEQUENTIAL)
+            try:
+                size = os.fstat(fd).st_size
+                if size > 0:
+                    hasher = _new_hasher(algorithm)
+                    try:
+                        SafeFileOperations._update_from_mmap(hasher, fd, size)
+                        return hasher.hexdigest()
+                    except (OSError, ValueError):
+                        pass  # Not mappable (e.g. special file), read it instead
+
+                if hasattr(hashlib, 'file_digest'):
+                    return hashlib.file_digest(f, _HASH_CTORS.get(algorithm, algorithm)).hexdigest()
+
+                hasher = _new_hasher(algorithm)
+                for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b''):
+                    hasher.update(chunk)
+            finally:
+                _fadvise(fd, _FADV_DONTNEED)
+
+        return hasher.hexdigest()
 
-        with open(filepath, 'rb') as f:
-            for chunk in iter(lambda: f.read(65536), b''):
-                hasher.update(chunk)
+    @staticmethod
+    def calculate_checksum_async(filepath: Union[str, Path],
+                                 algorithm: str = 'sha256') -> Future:
+        """
+        Calculate file checksum on a background thread
+
+        Args:
+            filepath: File to checksum
+            algorithm: Hash algorithm, as for calculate_checksum()
+
+        Returns:
+            Future resolving to the hexadecimal checksum string (or raising
+            what calculate_checksum() would raise)
+        """
+        return _get_checksum_executor().submit(
+            SafeFileOperations.calculate_checksum, filepath, algorithm
+        )
+
+    @staticmethod
+    def _update_from_mmap(hasher, fd: int, size: int) -> None:
+        """Feed a file to a hasher from a read-only memory map"""
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            advise = getattr(mm, 'madvise', None)  # Unix only
+            if advise:
+                advise(mmap.MADV_SEQUENTIAL)
+                if hasattr(mmap, 'MADV_WILLNEED'):
+                    advise(mmap.MADV_WILLNEED, 0, min(size, MMAP_WINDOW_SIZE))
+
+            drop_windows = (
+                advise is not None and size > MMAP_WINDOW_SIZE
+                and hasattr(mmap, 'MADV_DONTNEED')
+            )
+
+            with memoryview(mm) as view:
+                for offset in range(0, size, MMAP_WINDOW_SIZE):
+                    length = min(MMAP_WINDOW_SIZE, size - offset)
+                    with view[offset:offset + length] as window:
+                        hasher.update(window)
+                    if drop_windows:
+                        advise(mmap.MADV_DONTNEED, offset, length)
+
+    @staticmethod
+    def _fast_copy(src_fd: int, dst_fd: int, size: int,
+                   progress_callback: Optional[Callable] = None) -> int:
+        """
+        Copy size bytes between file descriptors
+
+        Data is copied in-kernel with copy_file_range() or sendfile() where
+        supported, falling back to a read/write loop. Kernel copies move as
+        much as one call allows when there is no progress to report, and at
+        most COPY_MAX_KERNEL_CALLS slices otherwise.
+
+        Returns:
+            Number of bytes copied
+        """
+        copied = 0
+
+        if progress_callback:
+            slice_size = max(COPY_SLICE_SIZE, -(-size // COPY_MAX_KERNEL_CALLS))
+            slice_size = min(slice_size, _MAX_KERNEL_COPY_COUNT)
+        else:
+            slice_size = _MAX_KERNEL_COPY_COUNT
+
+        for kernel_copy in _KERNEL_COPY_FUNCTIONS:
+            try:
+                while copied < size:
+                    count = kernel_copy(src_fd, dst_fd, min(slice_size, size - copied))
+                    if count == 0:
+                        return copied  # Source shrank during copy
+                    copied += count
+                    if progress_callback:
+                        progress_callback(copied, size)
+                return copied
+            except OSError as e:
+                # Only switch mechanism before anything has been written
+                if copied or e.errno not in _COPY_FALLBACK_ERRNOS:
+                    raise
+
+        while copied < size:
+            chunk = os.read(src_fd, min(COPY_SLICE_SIZE, size - copied))
+            if not chunk:
+                break
+            _write_all(dst_fd, chunk)
+            copied += len(chunk)
+            if progress_callback:
+                progress_callback(copied, size)
+
+        return copied
+
+    @staticmethod
+    def _copy_with_hash(src_path: Path, dst_path: Path, algorithm: str = 'sha256',
+                        progress_callback: Optional[Callable] = None) -> str:
+        """
+        Copy a file, hashing the source in the same pass
+
+        Returns:
+            Hexadecimal checksum of the source data
+        """
+        hasher = _new_hasher(algorithm)
+        buffer = bytearray(CHECKSUM_CHUNK_SIZE)
+
+        with open(src_path, 'rb', buffering=0) as src_f, \
+                open(dst_path, 'wb', buffering=0) as dst_f, \
+                memoryview(buffer) as view:
+            src_fd = src_f.fileno()
+            size = os.fstat(src_fd).st_size
+            dst_fd = dst_f.fileno()
+            copied = 0
+
+            _fadvise(src_fd, _FADV_SEQUENTIAL)
+            while count := src_f.readinto(buffer):
+                with view[:count] as chunk:
+                    hasher.update(chunk)
+                    _write_all(dst_fd, chunk)
+                copied += count
+                if progress_callback:
+                    progress_callback(copied, size)
+
+            # The destination is read back for verification; only the
+            # source can be dropped from the cache here
+            _fadvise(src_fd, _FADV_DONTNEED)
 
         return hasher.hexdigest()
 
@@ -370,42 +1106,65 @@ class SafeFileOperations:
             ChecksumError: If verification fails
             StorageError: On copy error
         """
-        src_path = FileSystemValidator.validate_path(src, must_exist=True)
+        src_path = FileSystemValidator.validate_path(src)
         dst_path = FileSystemValidator.validate_path(dst)
 
-        if not FileSystemValidator.check_readable(src_path):
+        src_info = FileSystemValidator.inspect(src_path)
+        if not src_info.exists:
+            raise PathError(f"Path does not exist: {src}")
+
+        if not src_info.readable:
             raise PermissionError(f"Cannot read source: {src_path}")
 
-        if not FileSystemValidator.check_writable(dst_path.parent):
+        dst_parent_info = FileSystemValidator.inspect(dst_path.parent)
+        if dst_parent_info.exists:
+            dst_writable = dst_parent_info.writable
+        else:
+            dst_writable = FileSystemValidator.check_writable(dst_path.parent)
+
+        if not dst_writable:
             raise PermissionError(f"Cannot write to destination: {dst_path.parent}")
 
         # Get source size for progress tracking
-        src_size = src_path.stat().st_size
+        src_size = src_info.size
 
         # Ensure sufficient space
         FileSystemValidator.ensure_space(dst_path, src_size)
 
         try:
-            if progress_callback:
-                # Copy with progress
-                bytes_copied = 0
-                with open(src_path, 'rb') as src_f, open(dst_path, 'wb') as dst_f:
-                    while chunk := src_f.read(65536):
-                        dst_f.write(chunk)
-                        bytes_copied += len(chunk)
-                        progress_callback(bytes_copied, src_size)
-            else:
-                # Simple copy
-                shutil.copy2(src_path, dst_path)
-
-            # Verify if requested
             if verify:
-                src_checksum = SafeFileOperations.calculate_checksum(src_path)
+                # Hash the source in the copy pass, so only the destination
+                # has to be read back
+                src_checksum = SafeFileOperations._copy_with_hash(
+                    src_path, dst_path, progress_callback=progress_callback
+                )
+                if not progress_callback:
+                    shutil.copystat(src_path, dst_path)  # Match copy2()
+
                 dst_checksum = SafeFileOperations.calculate_checksum(dst_path)
                 if src_checksum != dst_checksum:
                     raise ChecksumError(
                         f"Checksum mismatch: {src_path} -> {dst_path}"
                     )
+            elif progress_callback:
+                # Copy with progress
+                with open(src_path, 'rb', buffering=0) as src_f, \
+                        open(dst_path, 'wb', buffering=0) as dst_f:
+                    src_fd, dst_fd = src_f.fileno(), dst_f.fileno()
+                    _fadvise(src_fd, _FADV_SEQUENTIAL)
+                    SafeFileOperations._fast_copy(
+                        src_fd, dst_fd, src_size, progress_callback
+                    )
+                    # Neither side will be re-read; don't let the copy
+                    # evict hot pages (dirty destination pages stay until
+                    # written back)
+                    _fadvise(src_fd, _FADV_DONTNEED)
+                    _fadvise(dst_fd, _FADV_DONTNEED)
+            else:
+                # Simple copy
+                shutil.copy2(src_path, dst_path)
+
+            FileSystemValidator.notify_write(dst_path, src_size)
 
         except Exception as e:
             # Clean up partial copy
@@ -438,17 +1197,19 @@ class DirectoryManager:
         """
         path_obj = FileSystemValidator.validate_path(path)
 
-        if path_obj.exists():
-            if not path_obj.is_dir():
+        info = FileSystemValidator.inspect(path_obj)
+        if info.exists:
+            if not info.is_dir:
                 raise PathError(f"Path exists but is not a directory: {path}")
             return path_obj
 
         # Check parent is writable
         parent = path_obj.parent
-        if not parent.exists():
+        parent_info = FileSystemValidator.inspect(parent)
+        if not parent_info.exists:
             raise PathError(f"Parent directory does not exist: {parent}")
 
-        if not FileSystemValidator.check_writable(parent):
+        if not parent_info.writable:
             raise PermissionError(f"Cannot create directory in: {parent}")
 
         try:
@@ -474,8 +1235,9 @@ class DirectoryManager:
         """
         path_obj = FileSystemValidator.validate_path(path)
 
-        if path_obj.exists():
-            if not path_obj.is_dir():
+        info = FileSystemValidator.inspect(path_obj)
+        if info.exists:
+            if not info.is_dir:
                 raise PathError(f"Path exists but is not a directory: {path}")
             return path_obj
 
@@ -487,14 +1249,19 @@ class DirectoryManager:
 
     @staticmethod
     def safe_cleanup(path: Union[str, Path], pattern: str = "*",
-                    max_age_seconds: Optional[int] = None) -> int:
+                    max_age_seconds: Optional[int] = None,
+                    max_workers: int = IO_WORKERS) -> int:
         """
         Safely clean up files in a directory
 
+        Large batches of files are unlinked from a thread pool so that the
+        calls overlap on high-latency filesystems.
+
         Args:
             path: Directory to clean
             pattern: Glob pattern for files to remove (default: all)
             max_age_seconds: Only remove files older than this (optional)
+            max_workers: Maximum unlink threads (1 to remove serially)
 
         Returns:
             Number of files removed
@@ -510,47 +1277,119 @@ class DirectoryManager:
         if not path_obj.is_dir():
             raise PathError(f"Not a directory: {path}")
 
-        removed_count = 0
         current_time = time.time()
+        candidates = []
 
-        for file_path in path_obj.glob(pattern):
-            if not file_path.is_file():
-                continue
-
-            # Check age if specified
-            if max_age_seconds is not None:
-                file_age = current_time - file_path.stat().st_mtime
-                if file_age < max_age_seconds:
+        if '/' in pattern or os.sep in pattern or '**' in pattern:
+            # Multi-component patterns need pathlib's recursive matching
+            for file_path in path_obj.glob(pattern):
+                if not file_path.is_file():
                     continue
 
-            try:
-                file_path.unlink()
-                removed_count += 1
-            except OSError as e:
-                # Log but continue with other files
-                print(f"Warning: Could not remove {file_path}: {e}")
+                # Check age if specified
+                if max_age_seconds is not None:
+                    file_age = current_time - file_path.stat().st_mtime
+                    if file_age < max_age_seconds:
+                        continue
 
-        return removed_count
+                candidates.append(file_path)
+        else:
+            # Match names straight from the directory listing
+            matches = _compile_glob(pattern)
+            with os.scandir(path_obj) as entries:
+                for entry in entries:
+                    if not matches(entry.name) or not entry.is_file():
+                        continue
+
+                    # Check age if specified
+                    if max_age_seconds is not None:
+                        file_age = current_time - entry.stat().st_mtime
+                        if file_age < max_age_seconds:
+                            continue
+
+                    candidates.append(entry.path)
+
+        if max_workers > 1 and len(candidates) >= PARALLEL_CLEANUP_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                errors = list(pool.map(DirectoryManager._try_unlink, candidates))
+        else:
+            errors = list(map(DirectoryManager._try_unlink, candidates))
+
+        # Continue past failures and report them once at the end
+        failed = [(str(file_path), str(error))
+                  for file_path, error in zip(candidates, errors)
+                  if error is not None]
+        if failed:
+            logger.warning("%d files failed to unlink: %r",
+                           len(failed), failed[:10])
+
+        return len(candidates) - len(failed)
+
+    @staticmethod
+    def _try_unlink(file_path: Union[str, Path]) -> Optional[OSError]:
+        """Remove a file, returning the error instead of raising on failure"""
+        try:
+            os.unlink(file_path)
+            return None
+        except OSError as e:
+            return e
 
     @staticmethod
-    def get_directory_size(path: Union[str, Path]) -> int:
+    def get_directory_size(path: Union[str, Path],
+                           max_workers: int = IO_WORKERS) -> int:
         """
         Calculate total size of all files in a directory
 
+        Top-level subdirectories are sized concurrently from a thread pool.
+
         Args:
             path: Directory path
+            max_workers: Maximum scanning threads (1 to scan serially)
 
         Returns:
             Total size in bytes
         """
         path_obj = FileSystemValidator.validate_path(path, must_exist=True)
 
+        total_size, subdirs = DirectoryManager._scan_entries(str(path_obj))
+
+        if max_workers > 1 and len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                return total_size + sum(pool.map(DirectoryManager._scan_size, subdirs))
+
+        return total_size + sum(map(DirectoryManager._scan_size, subdirs))
+
+    @staticmethod
+    def _scan_size(path: str) -> int:
+        """Sum file sizes below a directory"""
+        total_size, subdirs = DirectoryManager._scan_entries(path)
+        return total_size + sum(map(DirectoryManager._scan_size, subdirs))
+
+    @staticmethod
+    def _scan_entries(path: str) -> Tuple[int, List[str]]:
+        """
+        List one directory level with os.scandir
+
+        Entry types come from the directory listing itself, so only files
+        need a stat() call. Symlinked directories are not followed.
+
+        Returns:
+            Tuple of (total size of files in the directory, subdirectory paths)
+        """
         total_size = 0
-        for file_path in path_obj.rglob('*'):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        subdirs = []
 
-        return total_size
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+        except OSError:
+            pass  # Unreadable or vanished subtree, skipped as rglob() did
+
+        return total_size, subdirs
 
 
 class TemporaryFileManager:
@@ -558,18 +1397,27 @@ class TemporaryFileManager:
 
     @staticmethod
     @contextmanager
-    def temporary_directory(prefix: str = "aamva_", cleanup: bool = True):
+    def temporary_directory(prefix: str = "aamva_", cleanup: bool = True,
+                            prefer_tmpfs: bool = False,
+                            destination: Optional[Union[str, Path]] = None):
         """
         Create a temporary directory with automatic cleanup
 
         Args:
             prefix: Directory name prefix
             cleanup: If True, remove directory on exit
+            prefer_tmpfs: If True, create it on tmpfs (/dev/shm) when
+                available and TMPDIR is unset; RAM-backed, so only for
+                small, short-lived data
+            destination: Directory its contents will be renamed into, if any;
+                keeps the temporary directory on the same filesystem
 
         Yields:
             Path to temporary directory
         """
-        temp_dir = Path(tempfile.mkdtemp(prefix=prefix))
+        temp_dir = Path(tempfile.mkdtemp(
+            prefix=prefix, dir=_temp_parent(prefer_tmpfs, destination)
+        ))
 
         try:
             yield temp_dir
@@ -578,12 +1426,15 @@ class TemporaryFileManager:
                 try:
                     shutil.rmtree(temp_dir)
                 except Exception as e:
-                    print(f"Warning: Could not clean up temp directory {temp_dir}: {e}")
+                    logger.warning("Could not clean up temp directory %s: %s",
+                                   temp_dir, e)
 
     @staticmethod
     @contextmanager
     def temporary_file(suffix: str = "", prefix: str = "aamva_",
-                      mode: str = 'w+b', cleanup: bool = True):
+                      mode: str = 'w+b', cleanup: bool = True,
+                      prefer_tmpfs: bool = False,
+                      destination: Optional[Union[str, Path]] = None):
         """
         Create a temporary file with automatic cleanup
 
@@ -592,11 +1443,19 @@ class TemporaryFileManager:
             prefix: Filename prefix
             mode: File mode
             cleanup: If True, remove file on exit
+            prefer_tmpfs: If True, create it on tmpfs (/dev/shm) when
+                available and TMPDIR is unset; RAM-backed, so only for
+                small, short-lived data
+            destination: Directory the file will be renamed into, if any;
+                keeps the temporary file on the same filesystem
 
         Yields:
             Tuple of (file handle, Path)
         """
-        temp_fd, temp_path = tempfile.mkstemp(suffix=suffix, prefix=prefix)
+        temp_fd, temp_path = tempfile.mkstemp(
+            suffix=suffix, prefix=prefix,
+            dir=_temp_parent(prefer_tmpfs, destination)
+        )
         temp_path_obj = Path(temp_path)
 
         try:
@@ -614,4 +1473,5 @@ class TemporaryFileManager:
                 try:
                     temp_path_obj.unlink()
                 except Exception as e:
-                    print(f"Warning: Could not clean up temp file {temp_path_obj}: {e}")
+                    logger.warning("Could not clean up temp file %s: %s",
+                                   temp_path_obj, e)
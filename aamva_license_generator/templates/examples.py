@@ -11,7 +11,7 @@ Version: 1.0.0
 """
 
 from pathlib import Path
-from datetime import datetime
+from datetime import date
 
 from .template import Template, TemplateParameter, ParameterType
 from .template_manager import TemplateManager
@@ -26,8 +26,7 @@ def example_1_list_builtin_templates():
     print("=" * 60)
 
     print("\nBuilt-in template names:")
-    for name in list_builtin_template_names():
-        print(f"  - {name}")
+    print('\n'.join(f"  - {name}" for name in list_builtin_template_names()))
 
     print("\n" + get_builtin_template_summary())
 
@@ -49,8 +48,8 @@ def example_2_load_and_inspect_template():
         print(f"Description: {template.description}")
         print(f"Tags: {', '.join(template.tags)}")
         print(f"\nParameters:")
-        for key, value in template.parameters.items():
-            print(f"  {key}: {value}")
+        if template.parameters:
+            print('\n'.join(f"  {key}: {value}" for key, value in template.parameters.items()))
 
         print(f"\nFull summary:")
         print(template.get_summary())
@@ -139,8 +138,7 @@ This template generates licenses for senior citizens in California.
         print("\n✓ Template is valid!")
     else:
         print("\n✗ Template has errors:")
-        for error in errors:
-            print(f"  - {error}")
+        print('\n'.join(f"  - {error}" for error in errors))
 
     # Save to manager
     try:
@@ -195,14 +193,15 @@ def example_5_search_templates():
 
     manager = TemplateManager()
 
-    # Search for templates
+    # Search for templates, loading them once for all the queries
     search_queries = ['age', 'test', 'demo']
+    manager.build_search_index(include_builtin=True)
 
     for query in search_queries:
         results = manager.search(query, include_builtin=True)
         print(f"\nSearch results for '{query}':")
-        for template in results:
-            print(f"  - {template.name}: {template.description}")
+        if results:
+            print('\n'.join(f"  - {template.name}: {template.description}" for template in results))
 
 
 def example_6_template_variables():
@@ -223,7 +222,7 @@ def example_6_template_variables():
         },
         variables={
             'STATE': 'CA',
-            'DATE': datetime.now().strftime('%Y-%m-%d'),
+            'DATE': date.today().isoformat(),
             'COUNT': '10',
         },
     )
@@ -310,8 +309,7 @@ def example_8_validation():
 
     if not is_valid:
         print(f"\n✗ Template has {len(errors)} errors:")
-        for i, error in enumerate(errors, 1):
-            print(f"  {i}. {error}")
+        print('\n'.join(f"  {i}. {error}" for i, error in enumerate(errors, 1)))
     else:
         print("\n✓ Template is valid (unexpected!)")
 
@@ -339,10 +337,13 @@ def example_9_list_user_templates():
 
     if user_templates:
         print("\nUser templates:")
+        lines = []
         for name in user_templates:
             info = manager.get_template_info(name)
             if info:
-                print(f"  - {name} (v{info['version']}): {info['description']}")
+                lines.append(f"  - {name} (v{info['version']}): {info['description']}")
+        if lines:
+            print('\n'.join(lines))
     else:
         print("\nNo user templates found.")
 
@@ -12,11 +12,18 @@ Version: 1.0.0
 
 import json
 import re
-from dataclasses import dataclass, field, asdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import sys
+from dataclasses import dataclass, field, asdict, replace
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class ParameterType(Enum):
     """Parameter data types supported in templates"""
@@ -42,18 +49,232 @@ class ValidationRule(Enum):
     CUSTOM = 'custom'
 
 
-@dataclass
+# ParameterType by value, for loading definitions without Enum.__call__
+_PARAMETER_TYPES_BY_VALUE: Dict[str, ParameterType] = {pt.value: pt for pt in ParameterType}
+
+
+def _now_iso() -> str:
+    """
+    Current UTC time for template metadata.
+
+    Same naive ISO format as datetime.utcnow().isoformat(), which is
+    deprecated.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _parameter_type(value: Any) -> ParameterType:
+    """Look up a ParameterType by value; unknown values raise ValueError"""
+    try:
+        return _PARAMETER_TYPES_BY_VALUE[value]
+    except (KeyError, TypeError):
+        return ParameterType(value)
+
+
+# Type check and expected-type label for each parameter type; bool is an int
+# subclass, so numeric types reject it explicitly
+_TYPE_CHECKS: Dict[ParameterType, Tuple[Callable[[Any], bool], str]] = {
+    ParameterType.INTEGER: (lambda v: isinstance(v, int) and not isinstance(v, bool), 'integer'),
+    ParameterType.FLOAT: (lambda v: isinstance(v, (int, float)) and not isinstance(v, bool), 'number'),
+    ParameterType.STRING: (lambda v: isinstance(v, str), 'string'),
+    ParameterType.BOOLEAN: (lambda v: isinstance(v, bool), 'boolean'),
+    ParameterType.LIST: (lambda v: isinstance(v, (list, tuple)), 'list'),
+    ParameterType.DICT: (lambda v: isinstance(v, dict), 'dict'),
+}
+
+# dataclass(slots=True) needs Python 3.10+; older versions get regular classes
+_SLOTS: Dict[str, bool] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Marks a variable lookup that found nothing (None is a valid value)
+_UNSET = object()
+
+# ${NAME} placeholder; any name up to the closing brace, like str.replace saw
+_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+
+def _strip_final_newline(text: str) -> str:
+    """Drop one trailing newline, which '$' also matches before"""
+    return text[:-1] if text.endswith('\n') else text
+
+
+def _is_upper_ascii(text: str, length: int) -> bool:
+    text = _strip_final_newline(text)
+    return len(text) == length and text.isascii() and text.isalpha() and text.isupper()
+
+
+def _is_digits(text: str) -> bool:
+    text = _strip_final_newline(text)
+    return text != '' and text.isdecimal()
+
+
+# Common validation patterns checked with string methods instead of a regex;
+# each function matches exactly what re.match(pattern, text) would
+_SIMPLE_PATTERNS: Dict[str, Any] = {
+    r'^[A-Z]{2}$': lambda text: _is_upper_ascii(text, 2),
+    r'^[A-Z]{3}$': lambda text: _is_upper_ascii(text, 3),
+    r'^\d+$': _is_digits,
+}
+
+
+@lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> 're.Pattern[str]':
+    """Compile a validation pattern once and reuse it"""
+    return re.compile(pattern)
+
+
+def _intern_tags(tags: List[Any]) -> List[Any]:
+    """
+    Intern tag strings loaded from JSON.
+
+    Tag literals in code are already interned; doing the same for loaded
+    tags lets tag filtering compare equal tags by identity first.
+    """
+    return [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]
+
+
+def _pattern_check(pattern: Any, compiled: Optional['re.Pattern[str]']):
+    """Regex check for patterns without a string-method equivalent"""
+    def check_pattern(value):
+        nonlocal compiled
+        # Strings are compiled on first use and kept by this check, so
+        # a bad pattern still surfaces when validating, not when loading.
+        if compiled is None:
+            compiled = _compile_pattern(pattern)
+        if not compiled.match(str(value)):
+            return f"Value does not match pattern: {compiled.pattern}"
+        return None
+
+    return check_pattern
+
+
+# Loaded string parameter values up to this length (state codes, modes,
+# small enums) are interned; longer ones are rarely repeated
+_INTERN_VALUE_MAX_LEN = 16
+
+
+def _intern_parameters(parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Intern parameter names and short string values loaded from JSON.
+
+    The same names and values ('state': 'CA') repeat across templates;
+    interning makes them one shared object each.
+    """
+    if not isinstance(parameters, dict):
+        return parameters  # Left for the validator to report
+    return {
+        sys.intern(name) if isinstance(name, str) else name: (
+            sys.intern(value)
+            if isinstance(value, str) and len(value) <= _INTERN_VALUE_MAX_LEN
+            else value
+        )
+        for name, value in parameters.items()
+    }
+
+
+def _intern_str(value: Any) -> Any:
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _orjson_dumps(data: Any, indent: Optional[int]) -> Optional[bytes]:
+    """
+    Encode with orjson when it is installed and can match json.dumps.
+
+    orjson only indents by 2; None is returned for other indents and for
+    anything it cannot encode the same way (e.g. very large ints), so the
+    caller falls back to json.
+    """
+    if orjson is None or indent not in (2, None):
+        return None
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if indent == 2:
+        option |= orjson.OPT_INDENT_2
+    try:
+        return orjson.dumps(data, option=option, default=str)
+    except orjson.JSONEncodeError:
+        return None
+
+
+def _drop_defaults(data: Dict[str, Any], defaults: Mapping[str, Any],
+                   containers: Sequence[str]) -> Dict[str, Any]:
+    """Drop entries that from_dict would fill in with the same value"""
+    return {
+        key: value for key, value in data.items()
+        if not (key in containers and not value)
+        and not (key in defaults and value == defaults[key])
+    }
+
+
+def _build_checks(validation: Mapping[str, Any]) -> tuple:
+    """
+    Turn a validation dict into a tuple of checks.
+
+    Each check takes a value and returns an error message, or None if the
+    value passes. Checks run in the same order the rules were always
+    applied: range, length, pattern, then enum.
+    """
+    checks = []
+
+    if 'min_value' in validation:
+        lo = validation['min_value']
+        lo_error = f"Value must be >= {lo}"
+        checks.append(lambda value: lo_error if value < lo else None)
+
+    if 'max_value' in validation:
+        hi = validation['max_value']
+        hi_error = f"Value must be <= {hi}"
+        checks.append(lambda value: hi_error if value > hi else None)
+
+    if 'min_length' in validation:
+        min_length = validation['min_length']
+        min_length_error = f"Length must be >= {min_length}"
+        checks.append(lambda value: min_length_error if len(value) < min_length else None)
+
+    if 'max_length' in validation:
+        max_length = validation['max_length']
+        max_length_error = f"Length must be <= {max_length}"
+        checks.append(lambda value: max_length_error if len(value) > max_length else None)
+
+    if 'pattern' in validation:
+        pattern = validation['pattern']
+        compiled = pattern if isinstance(pattern, re.Pattern) else None
+        source = pattern if compiled is None else compiled.pattern
+        simple_match = None
+        if isinstance(source, str) and (compiled is None or compiled.flags == re.UNICODE):
+            simple_match = _SIMPLE_PATTERNS.get(source)
+
+        if simple_match is not None:
+            source_error = f"Value does not match pattern: {source}"
+            checks.append(lambda value: None if simple_match(str(value)) else source_error)
+        else:
+            checks.append(_pattern_check(pattern, compiled))
+
+    if 'enum_values' in validation:
+        enum_values = validation['enum_values']
+        enum_error = f"Value must be one of: {', '.join(map(str, enum_values))}"
+        checks.append(lambda value: enum_error if value not in enum_values else None)
+
+    return tuple(checks)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class TemplateParameter:
     """
     Represents a single parameter in a template.
 
+    Parameters are immutable, so one definition can be shared by many
+    templates. The validation rules are turned into checks once, when the
+    parameter is created, so replace the parameter rather than editing
+    its validation dict in place.
+
     Attributes:
         name: Parameter name (e.g., 'state', 'count', 'age_range')
         type: Data type of the parameter
         default: Default value if not specified
         description: Human-readable description
         required: Whether the parameter is required
-        validation: Validation rules (min, max, pattern, etc.)
+        validation: Validation rules (min, max, pattern, etc.); 'pattern'
+            may be a regex string or a precompiled re.Pattern
         examples: Example values for documentation
     """
     name: str
@@ -63,6 +284,18 @@ class TemplateParameter:
     required: bool = False
     validation: Dict[str, Any] = field(default_factory=dict)
     examples: List[Any] = field(default_factory=list)
+    _checks: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, '_checks', _build_checks(self.validation))
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copies and pickles recreate the checks
+        # instead of carrying the closures along.
+        return (self.__class__, (
+            self.name, self.type, self.default, self.description,
+            self.required, self.validation, self.examples,
+        ))
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
@@ -72,16 +305,31 @@ class TemplateParameter:
             'default': self.default,
             'description': self.description,
             'required': self.required,
-            'validation': self.validation,
+            'validation': self._serializable_validation(),
             'examples': self.examples,
         }
 
+    def to_dict_compact(self) -> Dict[str, Any]:
+        """Like to_dict(), leaving out fields that still have their defaults"""
+        return _drop_defaults(
+            self.to_dict(),
+            {'default': None, 'description': '', 'required': False},
+            ('validation', 'examples'),
+        )
+
+    def _serializable_validation(self) -> Dict[str, Any]:
+        """Validation rules with any precompiled pattern given as its source"""
+        pattern = self.validation.get('pattern')
+        if isinstance(pattern, re.Pattern):
+            return {**self.validation, 'pattern': pattern.pattern}
+        return self.validation
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TemplateParameter':
         """Create from dictionary representation"""
         return cls(
-            name=data['name'],
-            type=ParameterType(data['type']),
+            name=_intern_str(data['name']),
+            type=_parameter_type(data['type']),
             default=data.get('default'),
             description=data.get('description', ''),
             required=data.get('required', False),
@@ -107,44 +355,54 @@ class TemplateParameter:
             return True, None
 
         # Type validation
-        if self.type == ParameterType.INTEGER and not isinstance(value, int):
-            return False, f"Expected integer, got {type(value).__name__}"
-        elif self.type == ParameterType.FLOAT and not isinstance(value, (int, float)):
-            return False, f"Expected number, got {type(value).__name__}"
-        elif self.type == ParameterType.STRING and not isinstance(value, str):
-            return False, f"Expected string, got {type(value).__name__}"
-        elif self.type == ParameterType.BOOLEAN and not isinstance(value, bool):
-            return False, f"Expected boolean, got {type(value).__name__}"
-        elif self.type == ParameterType.LIST and not isinstance(value, list):
-            return False, f"Expected list, got {type(value).__name__}"
-        elif self.type == ParameterType.DICT and not isinstance(value, dict):
-            return False, f"Expected dict, got {type(value).__name__}"
-
-        # Validation rules
-        if 'min_value' in self.validation and value < self.validation['min_value']:
-            return False, f"Value must be >= {self.validation['min_value']}"
-
-        if 'max_value' in self.validation and value > self.validation['max_value']:
-            return False, f"Value must be <= {self.validation['max_value']}"
-
-        if 'min_length' in self.validation and len(value) < self.validation['min_length']:
-            return False, f"Length must be >= {self.validation['min_length']}"
-
-        if 'max_length' in self.validation and len(value) > self.validation['max_length']:
-            return False, f"Length must be <= {self.validation['max_length']}"
-
-        if 'pattern' in self.validation:
-            if not re.match(self.validation['pattern'], str(value)):
-                return False, f"Value does not match pattern: {self.validation['pattern']}"
-
-        if 'enum_values' in self.validation:
-            if value not in self.validation['enum_values']:
-                return False, f"Value must be one of: {', '.join(map(str, self.validation['enum_values']))}"
+        type_check = _TYPE_CHECKS.get(self.type)
+        if type_check is not None and not type_check[0](value):
+            return False, f"Expected {type_check[1]}, got {type(value).__name__}"
+
+        for check in self._checks:
+            error = check(value)
+            if error is not None:
+                return False, error
 
         return True, None
 
 
-@dataclass
+class ParameterDefinitions(tuple):
+    """
+    Immutable sequence of TemplateParameter definitions.
+
+    Behaves like a tuple, and can also be indexed by parameter name:
+    definitions['state'] looks the definition up in a dictionary built
+    once at construction. required_names lists the required parameters
+    in definition order.
+    """
+
+    def __new__(cls, definitions: Union[Iterable[TemplateParameter],
+                                        Mapping[str, TemplateParameter]] = ()):
+        if isinstance(definitions, Mapping):
+            definitions = definitions.values()
+        self = super().__new__(cls, definitions)
+        self._by_name = {p.name: p for p in self}
+        self.required_names = tuple(p.name for p in self if p.required)
+        return self
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self._by_name[key]
+        return super().__getitem__(key)
+
+    def __contains__(self, item) -> bool:
+        if isinstance(item, str):
+            return item in self._by_name
+        return super().__contains__(item)
+
+    def get(self, name: str, default: Optional[TemplateParameter] = None
+            ) -> Optional[TemplateParameter]:
+        """Get a definition by parameter name"""
+        return self._by_name.get(name, default)
+
+
+@dataclass(**_SLOTS)
 class TemplateVariable:
     """
     Represents a variable that can be substituted in templates.
@@ -163,11 +421,16 @@ class TemplateVariable:
     name: str
     value: Any
     description: str = ''
+    _placeholder: tuple = field(default=(None, ''), init=False, repr=False, compare=False)
 
     @property
     def placeholder(self) -> str:
-        """Get the placeholder syntax for this variable"""
-        return f"${{{self.name}}}"
+        """Get the placeholder syntax for this variable (built once per name)"""
+        name, placeholder = self._placeholder
+        if name is not self.name:
+            placeholder = f"${{{self.name}}}"
+            self._placeholder = (self.name, placeholder)
+        return placeholder
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary representation"""
@@ -187,7 +450,7 @@ class TemplateVariable:
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Template:
     """
     Complete template definition for license generation.
@@ -200,9 +463,12 @@ class Template:
         version: Template version (semver)
         description: Detailed description of what this template does
         author: Template author/creator
-        tags: Tags for categorization (e.g., ['age_verification', 'testing'])
+        tags: Tags for categorization (e.g., ['age_verification', 'testing']);
+            a list, or a tuple for shared read-only tags
         parameters: Dictionary of parameters and their values
-        parameter_definitions: Definitions for each parameter
+        parameter_definitions: Definitions for each parameter; given as a
+            sequence or a name -> definition mapping and stored as
+            ParameterDefinitions, which can also be indexed by name
         parent_template: Name of parent template (for inheritance)
         variables: Runtime variables for substitution
         metadata: Additional metadata (created_at, updated_at, etc.)
@@ -212,20 +478,25 @@ class Template:
     version: str = '1.0.0'
     description: str = ''
     author: str = 'AAMVA Team'
-    tags: List[str] = field(default_factory=list)
+    tags: Sequence[str] = field(default_factory=list)
     parameters: Dict[str, Any] = field(default_factory=dict)
-    parameter_definitions: List[TemplateParameter] = field(default_factory=list)
+    parameter_definitions: ParameterDefinitions = field(default_factory=ParameterDefinitions)
     parent_template: Optional[str] = None
     variables: Dict[str, Any] = field(default_factory=dict)
     metadata: Dict[str, Any] = field(default_factory=dict)
     documentation: str = ''
 
     def __post_init__(self):
-        """Initialize metadata if not provided"""
-        if 'created_at' not in self.metadata:
-            self.metadata['created_at'] = datetime.utcnow().isoformat()
-        if 'updated_at' not in self.metadata:
-            self.metadata['updated_at'] = datetime.utcnow().isoformat()
+        """Index parameter definitions and initialize metadata if not provided"""
+        if not isinstance(self.parameter_definitions, ParameterDefinitions):
+            self.parameter_definitions = ParameterDefinitions(self.parameter_definitions)
+
+        # Loaded templates already carry both timestamps; only read the
+        # clock when one is missing
+        if 'created_at' not in self.metadata or 'updated_at' not in self.metadata:
+            now = _now_iso()
+            self.metadata.setdefault('created_at', now)
+            self.metadata.setdefault('updated_at', now)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert template to dictionary representation"""
@@ -243,9 +514,39 @@ class Template:
             'documentation': self.documentation,
         }
 
+    def to_dict_compact(self) -> Dict[str, Any]:
+        """
+        Like to_dict(), leaving out fields that still have their defaults.
+
+        from_dict() reads the result back to an equal template; it is
+        smaller to store and send than the full form.
+        """
+        data = {
+            **self.to_dict(),
+            'parameter_definitions': [p.to_dict_compact() for p in self.parameter_definitions],
+        }
+        return _drop_defaults(
+            data,
+            {'version': '1.0.0', 'description': '', 'author': 'AAMVA Team',
+             'parent_template': None, 'documentation': ''},
+            ('tags', 'parameters', 'parameter_definitions', 'variables', 'metadata'),
+        )
+
     def to_json(self, indent: int = 2) -> str:
         """Convert template to JSON string"""
-        return json.dumps(self.to_dict(), indent=indent, default=str)
+        data = self.to_dict()
+        encoded = _orjson_dumps(data, indent)
+        if encoded is not None:
+            return encoded.decode()
+        return json.dumps(data, indent=indent, default=str)
+
+    def to_json_bytes(self, indent: int = 2) -> bytes:
+        """Convert template to UTF-8 encoded JSON, for writing to binary files"""
+        data = self.to_dict()
+        encoded = _orjson_dumps(data, indent)
+        if encoded is not None:
+            return encoded
+        return json.dumps(data, indent=indent, default=str).encode('utf-8')
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Template':
@@ -257,11 +558,11 @@ class Template:
 
         return cls(
             name=data['name'],
-            version=data.get('version', '1.0.0'),
+            version=_intern_str(data.get('version', '1.0.0')),
             description=data.get('description', ''),
-            author=data.get('author', 'AAMVA Team'),
-            tags=data.get('tags', []),
-            parameters=data.get('parameters', {}),
+            author=_intern_str(data.get('author', 'AAMVA Team')),
+            tags=_intern_tags(data.get('tags', [])),
+            parameters=_intern_parameters(data.get('parameters', {})),
             parameter_definitions=param_defs,
             parent_template=data.get('parent_template'),
             variables=data.get('variables', {}),
@@ -270,8 +571,15 @@ class Template:
         )
 
     @classmethod
-    def from_json(cls, json_str: str) -> 'Template':
-        """Create template from JSON string"""
+    def from_json(cls, json_str: Union[str, bytes]) -> 'Template':
+        """Create template from JSON string (or UTF-8 encoded bytes)"""
+        if orjson is not None:
+            try:
+                return cls.from_dict(orjson.loads(json_str))
+            except orjson.JSONDecodeError:
+                # Let json report the error, or accept what orjson rejects
+                # (NaN, Infinity)
+                pass
         data = json.loads(json_str)
         return cls.from_dict(data)
 
@@ -282,23 +590,28 @@ class Template:
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
-        errors = []
+        # Without definitions there is nothing to check against
+        param_defs = self.parameter_definitions
+        if not param_defs:
+            return True, []
 
-        # Create a lookup for parameter definitions
-        param_def_lookup = {p.name: p for p in self.parameter_definitions}
+        errors = []
 
         # Validate each parameter
         for param_name, param_value in self.parameters.items():
-            if param_name in param_def_lookup:
-                param_def = param_def_lookup[param_name]
+            param_def = param_defs.get(param_name)
+            if param_def is not None:
                 is_valid, error_msg = param_def.validate(param_value)
                 if not is_valid:
                     errors.append(f"{param_name}: {error_msg}")
 
         # Check for missing required parameters
-        for param_def in self.parameter_definitions:
-            if param_def.required and param_def.name not in self.parameters:
-                errors.append(f"{param_def.name}: Required parameter missing")
+        parameters = self.parameters
+        errors.extend(
+            f"{name}: Required parameter missing"
+            for name in param_defs.required_names
+            if name not in parameters
+        )
 
         return len(errors) == 0, errors
 
@@ -313,16 +626,26 @@ class Template:
         Returns:
             Text with variables substituted
         """
-        # Combine template variables with additional variables
-        all_vars = {**self.variables, **(additional_vars or {})}
-
-        # Find and replace all variables
-        result = text
-        for var_name, var_value in all_vars.items():
-            placeholder = f"${{{var_name}}}"
-            result = result.replace(placeholder, str(var_value))
-
-        return result
+        # Most values hold no placeholders at all
+        if '${' not in text:
+            return text
+
+        # Combine template variables with additional variables, copying
+        # only when there is something to combine
+        if additional_vars:
+            all_vars = self.variables.copy()
+            all_vars.update(additional_vars)
+        else:
+            all_vars = self.variables
+
+        # Replace every placeholder in one pass; unknown ones are left as-is
+        def replace_var(match: 're.Match[str]') -> str:
+            value = all_vars.get(match.group(1), _UNSET)
+            if value is _UNSET:
+                return match.group(0)
+            return value if isinstance(value, str) else str(value)
+
+        return _VAR_RE.sub(replace_var, text)
 
     def merge_with_parent(self, parent: 'Template') -> 'Template':
         """
@@ -339,13 +662,15 @@ class Template:
         # Merge parameters (child overrides parent)
         merged_params = {**parent.parameters, **self.parameters}
 
-        # Merge parameter definitions
-        parent_defs = {p.name: p for p in parent.parameter_definitions}
-        child_defs = {p.name: p for p in self.parameter_definitions}
-        merged_defs = {**parent_defs, **child_defs}
+        # Merge parameter definitions in one dict; child definitions replace
+        # the parent's in place, new ones are added after them
+        merged_defs = {}
+        for definitions in (parent.parameter_definitions, self.parameter_definitions):
+            for p in definitions:
+                merged_defs[p.name] = p
 
         # Merge tags
-        merged_tags = list(set(parent.tags + self.tags))
+        merged_tags = list(set(parent.tags).union(self.tags))
 
         # Merge variables
         merged_vars = {**parent.variables, **self.variables}
@@ -367,7 +692,11 @@ class Template:
 
     def clone(self, new_name: Optional[str] = None) -> 'Template':
         """
-        Create a deep copy of this template.
+        Create a copy of this template.
+
+        The parameters, variables, tags and metadata of the copy can be
+        changed without affecting this template; parameter definitions are
+        immutable and shared.
 
         Args:
             new_name: Optional new name for the cloned template
@@ -375,14 +704,44 @@ class Template:
         Returns:
             Cloned template
         """
-        cloned_data = self.to_dict()
-        if new_name:
-            cloned_data['name'] = new_name
-        cloned_data['metadata']['created_at'] = datetime.utcnow().isoformat()
-        cloned_data['metadata']['updated_at'] = datetime.utcnow().isoformat()
-        cloned_data['metadata']['cloned_from'] = self.name
+        now = _now_iso()
+        return replace(
+            self,
+            name=new_name or self.name,
+            tags=list(self.tags),
+            parameters=dict(self.parameters),
+            variables=dict(self.variables),
+            metadata={
+                **self.metadata,
+                'created_at': now,
+                'updated_at': now,
+                'cloned_from': self.name,
+            },
+        )
+
+    def with_overrides(self, **parameters: Any) -> 'Template':
+        """
+        Create a shallow copy of this template with some parameters changed.
+
+        Like clone(), top-level containers are copied while nested
+        parameter values and parameter definitions are shared with this
+        template, so replace them rather than modifying them in place.
+        Unlike clone(), the name and metadata are kept as they are.
 
-        return Template.from_dict(cloned_data)
+        Args:
+            **parameters: Parameter values to set on the copy
+
+        Returns:
+            New template
+        """
+        return replace(
+            self,
+            tags=list(self.tags),
+            parameters={**self.parameters, **parameters},
+            parameter_definitions=self.parameter_definitions,  # Immutable
+            variables=dict(self.variables),
+            metadata=dict(self.metadata),
+        )
 
     def get_summary(self) -> str:
         """Get a human-readable summary of this template"""
@@ -399,8 +758,7 @@ class Template:
 
         if self.parameters:
             lines.append("\nParameters:")
-            for name, value in self.parameters.items():
-                lines.append(f"  - {name}: {value}")
+            lines.extend([f"  - {name}: {value}" for name, value in self.parameters.items()])
 
         return '\n'.join(lines)
 
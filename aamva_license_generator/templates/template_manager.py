@@ -14,13 +14,119 @@ Version: 1.0.0
 
 import json
 import os
-import shutil
-from datetime import datetime
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
-from .template import Template
-from .template_validator import TemplateValidator, ValidationError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .template import Template, _now_iso
+from .template_validator import TemplateValidator, ValidationError, _is_valid_name
+
+# Index of user template names, descriptions, tags and versions, kept in the
+# templates directory; the leading dot keeps it clear of valid template names
+INDEX_FILENAME = '.index.json'
+
+
+def _atomic_write_bytes(path: Path, data: bytes, durable: bool = False):
+    """
+    Replace a file's contents atomically.
+
+    The data goes to a temporary file next to the target, which is then
+    renamed over it, so a crash leaves either the old file or the new one,
+    never a truncated one. The temporary name is unique per process and
+    thread and doesn't end in .json, so listings never see it.
+
+    Args:
+        path: File to write
+        data: Complete new contents
+        durable: fsync the data before the rename, so it survives a power
+            loss as well as a crash
+    """
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON file contents, with orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Let json report the error or accept NaN/Infinity
+    return json.loads(data)
+
+
+def _json_dumps(data: Any, indent: Optional[int] = None) -> bytes:
+    """
+    Encode JSON file contents, with orjson when it is installed.
+
+    orjson only indents by 2, and rejects some values json accepts (e.g.
+    very large ints); json is used for those.
+    """
+    if orjson is not None and indent in (2, None):
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(data, indent=indent).encode('utf-8')
+
+
+def _make_index_entry(data: Dict[str, Any], st: os.stat_result) -> Dict[str, Any]:
+    """Index entry for a template's JSON data and its file's stat result"""
+    return {
+        'description': data.get('description', ''),
+        'tags': list(data.get('tags') or []),
+        'version': data.get('version', '1.0.0'),
+        'parent_template': data.get('parent_template'),
+        'mtime_ns': st.st_mtime_ns,
+        'size': st.st_size,
+    }
+
+
+def _iter_template_names(directory: Path) -> Iterator[str]:
+    """
+    Yield the names of the template files in a directory.
+
+    Uses os.scandir, whose entries already know their type, instead of
+    building and checking a Path for every file. The index file is skipped,
+    and a missing directory yields nothing.
+    """
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if (name.endswith('.json') and name != INDEX_FILENAME
+                        and entry.is_file(follow_symlinks=False)):
+                    yield name[:-5]
+    except FileNotFoundError:
+        return
+
+
+def _search_text(name: str, description: str, tags: List[str]) -> str:
+    """
+    Lowercased text search() matches queries against.
+
+    NUL never appears in a query (see search), so matches can't span two
+    fields.
+    """
+    return '\0'.join([name, description, *tags]).lower()
 
 
 class TemplateManager:
@@ -35,13 +141,18 @@ class TemplateManager:
     - Import/export functionality
     """
 
-    def __init__(self, templates_dir: Optional[Path] = None):
+    # Most templates kept in the load cache; the least recently used go first
+    DEFAULT_CACHE_SIZE = 256
+
+    def __init__(self, templates_dir: Optional[Path] = None,
+                 cache_size: int = DEFAULT_CACHE_SIZE):
         """
         Initialize the template manager.
 
         Args:
             templates_dir: Directory for storing user templates.
                           Defaults to ~/.aamva-templates/
+            cache_size: Most loaded templates to keep cached
         """
         if templates_dir is None:
             templates_dir = Path.home() / '.aamva-templates'
@@ -56,16 +167,39 @@ class TemplateManager:
         # Template validator
         self.validator = TemplateValidator()
 
-        # Cache for loaded templates
-        self._cache: Dict[str, Template] = {}
-
-    def save(self, template: Template, overwrite: bool = False) -> Path:
+        # LRU caches for loaded templates: as stored, and merged with their
+        # parents (only templates that have one)
+        self._cache: 'OrderedDict[str, Template]' = OrderedDict()
+        self._resolved_cache: 'OrderedDict[str, Template]' = OrderedDict()
+        self._cache_size = cache_size
+
+        # Search index built by build_search_index(), keyed by include_builtin
+        self._search_index: Dict[bool, List[Tuple[str, Template]]] = {}
+
+        # Name, description, tags and version of each template file, so
+        # filtering and searching don't parse every file on every call.
+        # User entries persist in INDEX_FILENAME and are checked against
+        # the file's mtime and size; built-in names and entries ship with
+        # the package and are read once.
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        self._index_dirty = False
+        self._builtin_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._builtin_names: Optional[Tuple[str, ...]] = None
+        self._entry_search_texts: Dict[str, Tuple[Dict[str, Any], str]] = {}
+
+    def save(self, template: Template, overwrite: bool = False,
+             durable: bool = False) -> Path:
         """
         Save a template to disk.
 
+        The file is replaced atomically, so an interrupted save never
+        leaves a truncated template behind.
+
         Args:
             template: Template to save
             overwrite: Whether to overwrite if template already exists
+            durable: Also fsync the file before replacing it, so the save
+                survives a power loss
 
         Returns:
             Path to the saved template file
@@ -74,33 +208,57 @@ class TemplateManager:
             FileExistsError: If template exists and overwrite=False
             ValidationError: If template validation fails
         """
+        return self._save(template, overwrite, _now_iso(), durable)
+
+    def _save(self, template: Template, overwrite: bool, now: str,
+              durable: bool = False) -> Path:
+        """save() with the timestamp to record, so callers can share one"""
         # Validate template
-        is_valid, errors = self.validator.validate(template)
+        is_valid, errors = self.validator.validate(template, fast=True)
         if not is_valid:
             raise ValidationError(f"Template validation failed: {'; '.join(errors)}")
 
         # Check if template already exists
-        template_path = self.templates_dir / f"{template.name}.json"
-        if template_path.exists() and not overwrite:
-            raise FileExistsError(
-                f"Template '{template.name}' already exists. "
-                "Use overwrite=True to replace it."
-            )
+        template_path, existed = self._target_path(template.name, overwrite)
 
         # Update metadata
-        template.metadata['updated_at'] = datetime.utcnow().isoformat()
-        if not template_path.exists():
-            template.metadata['created_at'] = datetime.utcnow().isoformat()
+        template.metadata['updated_at'] = now
+        if not existed:
+            template.metadata['created_at'] = now
 
         # Save to file
-        with open(template_path, 'w') as f:
-            f.write(template.to_json(indent=2))
-
-        # Update cache
-        self._cache[template.name] = template
+        _atomic_write_bytes(template_path, template.to_json_bytes(indent=2), durable)
 
+        # Update cache and index
+        self._record_saved(template, template.to_dict(), template_path)
         return template_path
 
+    def _target_path(self, name: str, overwrite: bool) -> Tuple[Path, bool]:
+        """
+        Path to save a user template to, and whether it already exists.
+
+        Raises:
+            FileExistsError: If the template exists and overwrite=False
+        """
+        template_path = self.templates_dir / f"{name}.json"
+        existed = template_path.exists()
+        if existed and not overwrite:
+            raise FileExistsError(
+                f"Template '{name}' already exists. "
+                "Use overwrite=True to replace it."
+            )
+        return template_path, existed
+
+    def _record_saved(self, template: Template, data: Dict[str, Any], template_path: Path):
+        """Update the cache and index for a template just written as data"""
+        self._cache_put(self._cache, template.name, template)
+        # Merged templates may include the old version of this one
+        self._resolved_cache.clear()
+        self._search_index.clear()
+        self._index[template.name] = _make_index_entry(data, template_path.stat())
+        self._index_dirty = True
+        self._write_index()
+
     def load(self, name: str, resolve_inheritance: bool = True) -> Optional[Template]:
         """
         Load a template by name.
@@ -118,44 +276,78 @@ class TemplateManager:
             Template instance or None if not found
 
         Raises:
-            ValidationError: If template is invalid
+            ValidationError: If template is invalid or its inheritance
+                forms a cycle
         """
-        # Check cache first
-        if name in self._cache:
-            return self._cache[name]
+        if not resolve_inheritance:
+            return self._load_unresolved(name)
+        return self._load_resolved(name, ())
 
-        # Try user templates
-        template_path = self.templates_dir / f"{name}.json"
-        if not template_path.exists():
-            # Try built-in templates
-            template_path = self.builtin_dir / f"{name}.json"
-            if not template_path.exists():
-                return None
+    def _load_resolved(self, name: str, chain: Tuple[str, ...]) -> Optional[Template]:
+        """
+        Load a template merged with its parents.
+
+        chain holds the templates whose parents are being resolved, so an
+        inheritance cycle is reported instead of recursing without end.
+        """
+        if name in chain:
+            raise ValidationError(
+                f"Inheritance cycle: {' -> '.join(chain)} -> {name}"
+            )
+
+        # Check cache first
+        resolved = self._cache_get(self._resolved_cache, name)
+        if resolved is not None:
+            return resolved
+
+        template = self._load_unresolved(name)
+        if template is None or not template.parent_template:
+            return template
+
+        # Resolve inheritance; each merge is cached so siblings sharing a
+        # parent chain reuse it instead of merging again
+        parent = self._load_resolved(template.parent_template, chain + (name,))
+        if parent is None:
+            raise ValidationError(
+                f"Parent template '{template.parent_template}' not found"
+            )
+        resolved = template.merge_with_parent(parent)
+        self._cache_put(self._resolved_cache, name, resolved)
+        return resolved
+
+    def _load_unresolved(self, name: str) -> Optional[Template]:
+        """Load and validate a template as stored, without its parents"""
+        cached = self._cache_get(self._cache, name)
+        if cached is not None:
+            return cached
+
+        template_path = self._find_template_file(name)
+        if template_path is None:
+            return None
 
         # Load from file
-        with open(template_path, 'r') as f:
+        with open(template_path, 'rb') as f:
             template = Template.from_json(f.read())
 
         # Validate
-        is_valid, errors = self.validator.validate(template)
+        is_valid, errors = self.validator.validate(template, fast=True)
         if not is_valid:
             raise ValidationError(
                 f"Template '{name}' is invalid: {'; '.join(errors)}"
             )
 
-        # Resolve inheritance if needed
-        if resolve_inheritance and template.parent_template:
-            parent = self.load(template.parent_template, resolve_inheritance=True)
-            if parent is None:
-                raise ValidationError(
-                    f"Parent template '{template.parent_template}' not found"
-                )
-            template = template.merge_with_parent(parent)
-
         # Cache and return
-        self._cache[name] = template
+        self._cache_put(self._cache, name, template)
         return template
 
+    def _find_template_file(self, name: str) -> Optional[Path]:
+        """The user template file for name, else the built-in one, else None"""
+        for directory in (self.templates_dir, self.builtin_dir):
+            template_path = directory / f"{name}.json"
+            if template_path.exists():
+                return template_path
+        return None
+
     def load_builtin(self, name: str) -> Optional[Template]:
         """
         Load a built-in template.
@@ -170,7 +362,7 @@ class TemplateManager:
         if not template_path.exists():
             return None
 
-        with open(template_path, 'r') as f:
+        with open(template_path, 'rb') as f:
             template = Template.from_json(f.read())
 
         return template
@@ -194,9 +386,13 @@ class TemplateManager:
 
         template_path.unlink()
 
-        # Remove from cache
-        if name in self._cache:
-            del self._cache[name]
+        # Remove from cache and index
+        self._cache.pop(name, None)
+        self._resolved_cache.clear()
+        self._search_index.clear()
+        if self._index.pop(name, None) is not None:
+            self._index_dirty = True
+            self._write_index()
 
         return True
 
@@ -213,61 +409,240 @@ class TemplateManager:
             tags: Filter by tags (any tag matches)
 
         Returns:
-            List of template names
+            Sorted list of template names
+        """
+        return sorted(self.iter_templates(include_builtin, tags))
+
+    def iter_templates(
+        self,
+        include_builtin: bool = True,
+        tags: Optional[List[str]] = None
+    ) -> Iterator[str]:
+        """
+        Yield available template names as they are found.
+
+        Like list_templates(), but unsorted, so callers that only need the
+        first few names can stop early (e.g. with itertools.islice).
+
+        Args:
+            include_builtin: Whether to include built-in templates
+            tags: Filter by tags (any tag matches)
+
+        Yields:
+            Template names
         """
-        templates = []
+        if tags:
+            for name, entry, is_builtin in self._template_entries(include_builtin):
+                template_tags = self._entry_tags(name, entry, is_builtin)
+                if any(tag in template_tags for tag in tags):
+                    yield name
+            return
 
         # User templates
+        seen = set()
+        for name in _iter_template_names(self.templates_dir):
+            seen.add(name)
+            yield name
+
+        # Built-in templates not shadowed by a user template
+        if include_builtin:
+            for name in self._get_builtin_names():
+                if name not in seen:
+                    yield name
+
+    def _template_entries(
+        self, include_builtin: bool
+    ) -> List[Tuple[str, Dict[str, Any], bool]]:
+        """
+        Index entries for every template, sorted by name.
+
+        Returns (name, entry, is_builtin) tuples; user templates shadow
+        built-in ones of the same name. Stale user entries are refreshed
+        and the index file rewritten if anything changed.
+        """
+        entries: Dict[str, Tuple[Dict[str, Any], bool]] = {}
+
         if self.templates_dir.exists():
-            for path in self.templates_dir.glob('*.json'):
-                template_name = path.stem
-                if tags:
-                    template = self.load(template_name)
-                    if template and any(tag in template.tags for tag in tags):
-                        templates.append(template_name)
-                else:
-                    templates.append(template_name)
-
-        # Built-in templates
-        if include_builtin and self.builtin_dir.exists():
-            for path in self.builtin_dir.glob('*.json'):
-                template_name = path.stem
-                if template_name not in templates:  # Avoid duplicates
-                    if tags:
-                        template = self.load_builtin(template_name)
-                        if template and any(tag in template.tags for tag in tags):
-                            templates.append(template_name)
-                    else:
-                        templates.append(template_name)
-
-        return sorted(templates)
+            for name in _iter_template_names(self.templates_dir):
+                entry = self._index_entry(self.templates_dir / f"{name}.json")
+                if entry is not None:
+                    entries[name] = (entry, False)
+            self._write_index()
+
+        if include_builtin:
+            for name, entry in self._get_builtin_index().items():
+                entries.setdefault(name, (entry, True))
+
+        return [(name, entry, is_builtin) for name, (entry, is_builtin) in sorted(entries.items())]
+
+    def _entry_tags(self, name: str, entry: Dict[str, Any], is_builtin: bool) -> List[str]:
+        """
+        Tags of an indexed template, without building a Template.
+
+        A cached template, or a user template whose tags depend on a
+        parent, goes through load() so inherited tags are still seen.
+        """
+        cached = self._cached_resolved(name)
+        if cached is not None:
+            return cached.tags
+
+        if not is_builtin and entry['parent_template']:
+            template = self.load(name)
+            return template.tags if template else []
+
+        return entry['tags']
+
+    def _entry_search_text(self, name: str, entry: Dict[str, Any]) -> str:
+        """
+        Lowercased search text for an indexed template (see search).
+
+        Text built from an index entry is kept until the entry is replaced,
+        so repeated searches don't rebuild it.
+        """
+        cached = self._cached_resolved(name)
+        if cached is None and entry['parent_template']:
+            cached = self.load(name)
+        if cached is not None:
+            return _search_text(cached.name, cached.description, cached.tags)
+
+        memo = self._entry_search_texts.get(name)
+        if memo is not None and memo[0] is entry:
+            return memo[1]
+        text = _search_text(name, entry['description'], entry['tags'])
+        self._entry_search_texts[name] = (entry, text)
+        return text
+
+    def _index_entry(self, path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Get the index entry for a user template file, re-reading the file
+        if it changed since the entry was made.
+        """
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+
+        entry = self._index.get(path.stem)
+        if entry is not None and entry.get('mtime_ns') == st.st_mtime_ns and entry.get('size') == st.st_size:
+            return entry
+
+        with open(path, 'rb') as f:
+            entry = _make_index_entry(_json_loads(f.read()), st)
+        self._index[path.stem] = entry
+        self._index_dirty = True
+        return entry
+
+    def _get_builtin_names(self) -> Tuple[str, ...]:
+        """Names of the built-in templates, listed once"""
+        if self._builtin_names is None:
+            self._builtin_names = tuple(sorted(_iter_template_names(self.builtin_dir)))
+        return self._builtin_names
+
+    def _get_builtin_index(self) -> Dict[str, Dict[str, Any]]:
+        """Index entries for the built-in templates, read once"""
+        if self._builtin_index is None:
+            builtin_index = {}
+            for name in self._get_builtin_names():
+                path = self.builtin_dir / f"{name}.json"
+                with open(path, 'rb') as f:
+                    builtin_index[name] = _make_index_entry(_json_loads(f.read()), path.stat())
+            self._builtin_index = builtin_index
+        return self._builtin_index
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the user template index; a missing or damaged one is rebuilt"""
+        try:
+            with open(self.templates_dir / INDEX_FILENAME, 'rb') as f:
+                index = _json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return index if isinstance(index, dict) else {}
+
+    def _write_index(self):
+        """Atomically write the user template index if it changed"""
+        if not self._index_dirty:
+            return
+
+        try:
+            _atomic_write_bytes(self.templates_dir / INDEX_FILENAME, _json_dumps(self._index))
+        except OSError:
+            return  # The index is only a cache; it is rebuilt from the files
+        self._index_dirty = False
+
+    def build_search_index(self, include_builtin: bool = True) -> None:
+        """
+        Index templates for repeated searches.
+
+        Loads every template once and keeps its name, description and tags
+        as a single lowercased string, so later search() calls with the same
+        include_builtin just scan those strings. The index is dropped by
+        save(), delete() and clear_cache(); rebuild it if templates change
+        on disk some other way.
+
+        Args:
+            include_builtin: Whether to include built-in templates
+        """
+        self._search_index[include_builtin] = self._search_entries(include_builtin)
+
+    def _search_entries(self, include_builtin: bool) -> List[Tuple[str, Template]]:
+        """Load templates and pair each with its lowercased search text"""
+        entries = []
+        for name in self.list_templates(include_builtin=include_builtin):
+            template = self.load(name)
+            if template is None:
+                continue
+            entries.append((_search_text(template.name, template.description, template.tags), template))
+        return entries
 
     def search(self, query: str, include_builtin: bool = True) -> List[Template]:
         """
         Search templates by name, description, or tags.
 
+        Uses the index from build_search_index() when there is one;
+        otherwise matches against the template index and loads only the
+        matching templates.
+
         Args:
             query: Search query string
             include_builtin: Whether to include built-in templates
 
         Returns:
-            List of matching templates
+            List of matching templates, sorted by name
         """
-        results = []
-        query_lower = query.lower()
+        return list(self.iter_search(query, include_builtin))
 
-        for name in self.list_templates(include_builtin=include_builtin):
-            template = self.load(name)
-            if template is None:
-                continue
+    def iter_search(self, query: str, include_builtin: bool = True) -> Iterator[Template]:
+        """
+        Yield templates matching a search, loading each only when reached.
 
-            # Search in name, description, and tags
-            if (query_lower in template.name.lower() or
-                query_lower in template.description.lower() or
-                any(query_lower in tag.lower() for tag in template.tags)):
-                results.append(template)
+        Like search(), but callers that only need the first few matches
+        can stop early without loading the rest.
 
-        return results
+        Args:
+            query: Search query string
+            include_builtin: Whether to include built-in templates
+
+        Yields:
+            Matching templates
+        """
+        query_lower = query.lower()
+        if '\0' in query_lower:
+            return
+
+        # Search in name, description, and tags
+        entries = self._search_index.get(include_builtin)
+        if entries is not None:
+            for text, template in entries:
+                if query_lower in text:
+                    yield template
+            return
+
+        # Match against the template index and load only the matches
+        for name, entry, _ in self._template_entries(include_builtin):
+            if query_lower in self._entry_search_text(name, entry):
+                template = self.load(name)
+                if template is not None:
+                    yield template
 
     def export_template(self, name: str, output_path: Union[str, Path]) -> Path:
         """
@@ -291,11 +666,10 @@ class TemplateManager:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         # Save with export metadata
-        template.metadata['exported_at'] = datetime.utcnow().isoformat()
+        template.metadata['exported_at'] = _now_iso()
         template.metadata['export_version'] = '1.0.0'
 
-        with open(output_path, 'w') as f:
-            f.write(template.to_json(indent=2))
+        _atomic_write_bytes(output_path, template.to_json_bytes(indent=2))
 
         return output_path
 
@@ -325,7 +699,7 @@ class TemplateManager:
             raise FileNotFoundError(f"Import file not found: {import_path}")
 
         # Load template
-        with open(import_path, 'r') as f:
+        with open(import_path, 'rb') as f:
             template = Template.from_json(f.read())
 
         # Rename if requested
@@ -333,11 +707,12 @@ class TemplateManager:
             template.name = new_name
 
         # Add import metadata
-        template.metadata['imported_at'] = datetime.utcnow().isoformat()
+        now = _now_iso()
+        template.metadata['imported_at'] = now
         template.metadata['imported_from'] = str(import_path)
 
-        # Save
-        self.save(template, overwrite=overwrite)
+        # Save, stamped with the same time
+        self._save(template, overwrite, now)
 
         return template
 
@@ -350,6 +725,10 @@ class TemplateManager:
         """
         Copy an existing template with a new name.
 
+        A template without a parent is copied as JSON: its contents were
+        validated when it was written, and only the name and timestamps
+        change.
+
         Args:
             source_name: Name of template to copy
             new_name: Name for the new template
@@ -360,17 +739,46 @@ class TemplateManager:
 
         Raises:
             FileNotFoundError: If source template not found
+            FileExistsError: If new_name exists and overwrite=False
+            ValidationError: If new_name is invalid, or a merged copy fails
+                validation
         """
-        source = self.load(source_name)
-        if source is None:
+        source_path = self._find_template_file(source_name)
+        if source_path is None:
             raise FileNotFoundError(f"Template '{source_name}' not found")
 
-        # Clone with new name
-        copied = source.clone(new_name=new_name)
+        with open(source_path, 'rb') as f:
+            data = _json_loads(f.read())
 
-        # Save
-        self.save(copied, overwrite=overwrite)
+        # A template with a parent is copied merged with it, and the
+        # merged result is validated in full
+        if data.get('parent_template'):
+            copied = self.load(source_name).clone(new_name=new_name)
+            self.save(copied, overwrite=overwrite)
+            return copied
 
+        # Otherwise only the name and timestamps change, so the JSON is
+        # copied as is instead of building, cloning and revalidating a
+        # Template; only the new name needs checking
+        if not _is_valid_name(new_name):
+            raise ValidationError(
+                f"Template validation failed: invalid template name '{new_name}' "
+                "(must be alphanumeric with underscores/hyphens)"
+            )
+        template_path, _ = self._target_path(new_name, overwrite)
+
+        now = _now_iso()
+        data['metadata'] = {
+            **(data.get('metadata') or {}),
+            'created_at': now,
+            'updated_at': now,
+            'cloned_from': data.get('name', source_name),
+        }
+        data['name'] = new_name
+        _atomic_write_bytes(template_path, _json_dumps(data, indent=2))
+
+        copied = Template.from_dict(data)
+        self._record_saved(copied, data, template_path)
         return copied
 
     def get_template_info(self, name: str) -> Optional[Dict[str, any]]:
@@ -421,20 +829,47 @@ class TemplateManager:
 
         return self.validator.validate(template)
 
+    @staticmethod
+    def _cache_get(cache: 'OrderedDict[str, Template]', name: str) -> Optional[Template]:
+        """Get a cached template, marking it as recently used"""
+        template = cache.get(name)
+        if template is not None:
+            cache.move_to_end(name)
+        return template
+
+    def _cache_put(self, cache: 'OrderedDict[str, Template]', name: str, template: Template):
+        """Cache a template, evicting the least recently used past the limit"""
+        cache[name] = template
+        cache.move_to_end(name)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    def _cached_resolved(self, name: str) -> Optional[Template]:
+        """A cached template with inheritance resolved, if there is one"""
+        resolved = self._resolved_cache.get(name)
+        if resolved is not None:
+            return resolved
+        template = self._cache.get(name)
+        if template is not None and not template.parent_template:
+            return template
+        return None
+
     def clear_cache(self):
-        """Clear the template cache."""
+        """Clear the template caches and any search index."""
         self._cache.clear()
+        self._resolved_cache.clear()
+        self._search_index.clear()
 
     def get_cache_size(self) -> int:
         """Get the number of cached templates."""
-        return len(self._cache)
+        return len(self._cache) + len(self._resolved_cache)
 
     def __str__(self) -> str:
         """String representation"""
-        user_count = len(list(self.templates_dir.glob('*.json')))
-        builtin_count = len(list(self.builtin_dir.glob('*.json'))) if self.builtin_dir.exists() else 0
+        user_count = sum(1 for _ in _iter_template_names(self.templates_dir))
+        builtin_count = len(self._get_builtin_names())
         return (
             f"TemplateManager(user_templates={user_count}, "
             f"builtin_templates={builtin_count}, "
-            f"cached={len(self._cache)})"
+            f"cached={self.get_cache_size()})"
         )
@@ -14,6 +14,22 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from .template import Template, TemplateParameter, ParameterType
 
+# Patterns used on every validation, compiled once
+_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$')
+_VARIABLE_NAME_RE = re.compile(r'^[A-Z][A-Z0-9_]*$')
+
+
+def _is_valid_name(name: str) -> bool:
+    """Check if template name is valid"""
+    # Allow alphanumeric, underscores, hyphens
+    return _NAME_RE.match(name) is not None
+
+
+def _is_valid_semver(version: str) -> bool:
+    """Check if version is valid semver"""
+    return _SEMVER_RE.match(version) is not None
+
 
 class ValidationError(Exception):
     """Raised when template validation fails"""
@@ -33,14 +49,22 @@ class TemplateValidator:
     - Cross-field validation
     """
 
+    __slots__ = ('schema_path', 'schema')
+
     # Valid state codes (subset - full list should be loaded from IIN data)
-    VALID_STATE_CODES = {
+    VALID_STATE_CODES: frozenset = frozenset({
         'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'DC', 'FL',
         'GA', 'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME',
         'MD', 'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH',
         'NJ', 'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI',
         'SC', 'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY',
-    }
+    })
+
+    # Values accepted for the 'state' parameter: a state code or 'ALL'.
+    # A set lookup is a single C call, and strings cache their hash (loaded
+    # state values are interned), so arithmetic on character codes in Python
+    # would only be slower.
+    _ACCEPTED_STATES: frozenset = VALID_STATE_CODES | {'ALL'}
 
     # Common parameter names and their expected types
     STANDARD_PARAMETERS = {
@@ -71,16 +95,33 @@ class TemplateValidator:
             with open(schema_path, 'r') as f:
                 self.schema = json.load(f)
 
-    def validate(self, template: Template) -> Tuple[bool, List[str]]:
+    def validate(self, template: Template, fast: bool = False) -> Tuple[bool, List[str]]:
         """
         Validate a template.
 
         Args:
             template: Template to validate
+            fast: Stop at the first group of checks that finds errors,
+                running the cheapest groups first. For callers that only
+                need to know whether the template is valid; reports
+                should use the default and get every error.
 
         Returns:
             Tuple of (is_valid, list_of_errors)
         """
+        if fast:
+            for check in (
+                self._validate_basic_fields,
+                self._validate_cross_fields,
+                self._validate_variables,
+                self._validate_parameters,
+                self._validate_business_rules,
+            ):
+                errors = check(template)
+                if errors:
+                    return False, errors
+            return True, []
+
         errors = []
 
         # Basic field validation
@@ -106,7 +147,7 @@ class TemplateValidator:
 
         if not template.name:
             errors.append("Template name is required")
-        elif not self._is_valid_name(template.name):
+        elif not _is_valid_name(template.name):
             errors.append(
                 "Template name must be alphanumeric with underscores/hyphens "
                 "(no spaces or special characters)"
@@ -114,7 +155,7 @@ class TemplateValidator:
 
         if not template.version:
             errors.append("Template version is required")
-        elif not self._is_valid_semver(template.version):
+        elif not _is_valid_semver(template.version):
             errors.append("Template version must be valid semver (e.g., 1.0.0)")
 
         if not template.description:
@@ -144,13 +185,14 @@ class TemplateValidator:
         errors.extend(param_errors)
 
         # Check for common parameter issues
-        if 'state' in template.parameters:
-            state = template.parameters['state']
-            if state and state not in self.VALID_STATE_CODES and state != 'ALL':
+        params = template.parameters
+        if 'state' in params:
+            state = params['state']
+            if state and state not in self._ACCEPTED_STATES:
                 errors.append(f"Invalid state code: {state}")
 
-        if 'count' in template.parameters:
-            count = template.parameters['count']
+        if 'count' in params:
+            count = params['count']
             if not isinstance(count, int):
                 errors.append(f"Count must be integer, got {type(count).__name__}")
             elif count < 1:
@@ -158,9 +200,9 @@ class TemplateValidator:
             elif count > 10000:
                 errors.append("Count should not exceed 10,000 for performance reasons")
 
-        if 'age_min' in template.parameters and 'age_max' in template.parameters:
-            age_min = template.parameters['age_min']
-            age_max = template.parameters['age_max']
+        if 'age_min' in params and 'age_max' in params:
+            age_min = params['age_min']
+            age_max = params['age_max']
             if age_min > age_max:
                 errors.append(f"age_min ({age_min}) cannot be greater than age_max ({age_max})")
 
@@ -169,10 +211,11 @@ class TemplateValidator:
     def _validate_variables(self, template: Template) -> List[str]:
         """Validate template variables"""
         errors = []
+        is_valid_variable_name = _VARIABLE_NAME_RE.match
 
-        for var_name, var_value in template.variables.items():
+        for var_name in template.variables:
             # Variable names should be uppercase with underscores
-            if not re.match(r'^[A-Z][A-Z0-9_]*$', var_name):
+            if not is_valid_variable_name(var_name):
                 errors.append(
                     f"Variable name '{var_name}' should be UPPER_CASE with underscores"
                 )
@@ -184,21 +227,22 @@ class TemplateValidator:
         errors = []
 
         # Check for conflicting parameters
-        if template.parameters.get('is_expired') and template.parameters.get('expiration_days_from_now', 0) > 0:
+        params = template.parameters
+        if params.get('is_expired') and params.get('expiration_days_from_now', 0) > 0:
             errors.append(
                 "Cannot have both is_expired=True and positive expiration_days_from_now"
             )
 
         # Validate age ranges make sense
-        if 'age_min' in template.parameters:
-            age_min = template.parameters['age_min']
+        if 'age_min' in params:
+            age_min = params['age_min']
             if age_min < 16:
                 errors.append("Minimum age should be at least 16 (minimum driving age)")
             if age_min > 100:
                 errors.append("Minimum age should not exceed 100")
 
-        if 'age_max' in template.parameters:
-            age_max = template.parameters['age_max']
+        if 'age_max' in params:
+            age_max = params['age_max']
             if age_max > 120:
                 errors.append("Maximum age should not exceed 120")
 
@@ -210,7 +254,7 @@ class TemplateValidator:
 
         # If parent template is specified, warn about potential issues
         if template.parent_template:
-            if not self._is_valid_name(template.parent_template):
+            if not _is_valid_name(template.parent_template):
                 errors.append(
                     f"Parent template name '{template.parent_template}' is invalid"
                 )
@@ -221,17 +265,9 @@ class TemplateValidator:
 
         return errors
 
-    @staticmethod
-    def _is_valid_name(name: str) -> bool:
-        """Check if template name is valid"""
-        # Allow alphanumeric, underscores, hyphens
-        return bool(re.match(r'^[a-zA-Z0-9_-]+$', name))
-
-    @staticmethod
-    def _is_valid_semver(version: str) -> bool:
-        """Check if version is valid semver"""
-        pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.]+)?(\+[a-zA-Z0-9.]+)?$'
-        return bool(re.match(pattern, version))
+    # Kept for callers that used the staticmethods
+    _is_valid_name = staticmethod(_is_valid_name)
+    _is_valid_semver = staticmethod(_is_valid_semver)
 
     def validate_json_schema(self, template_dict: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -269,7 +305,7 @@ class TemplateValidator:
             return False, [f"File not found: {file_path}"]
 
         try:
-            with open(file_path, 'r') as f:
+            with open(file_path, 'rb') as f:
                 template = Template.from_json(f.read())
         except json.JSONDecodeError as e:
             return False, [f"Invalid JSON: {e}"]
@@ -10,11 +10,71 @@ Administrators) standards including:
 - Subfile structure validation
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Mapping, Optional, Tuple
 from datetime import datetime, date
+from functools import lru_cache
+from types import MappingProxyType
 import re
 from .schemas import ValidationResult, ValidationLevel, FieldValidationResult
 
+# MMDDYYYY date fields, compiled once rather than looked up in re's cache
+# for every date field validated
+_DATE_RE = re.compile(r'^\d{8}$')
+
+
+def _freeze_fields(fields: Mapping[str, Mapping[str, Any]]) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Read-only copy of a field specification table, with lists as tuples.
+
+    Format checks are memoized per class and the lookup tables are derived
+    from the specifications once, so the specifications must not change
+    afterwards.
+    """
+    return MappingProxyType({
+        code: MappingProxyType({
+            key: tuple(value) if isinstance(value, list) else value
+            for key, value in spec.items()
+        })
+        for code, spec in fields.items()
+    })
+
+
+def _field_tables(
+    fields: Mapping[str, Mapping[str, Any]]
+) -> Tuple[Dict[str, FrozenSet[str]], Tuple[str, ...], Dict[str, int]]:
+    """
+    Lookup tables derived from a field specification table.
+
+    Returns the allowed values of each enum field as sets, for membership
+    checks (the specifications keep their order for messages and
+    suggestions); the mandatory field codes in specification order; and
+    the maximum length of each length-limited field.
+    """
+    value_sets = {
+        code: frozenset(spec["values"])
+        for code, spec in fields.items() if "values" in spec
+    }
+    mandatory = tuple(
+        code for code, spec in fields.items() if spec.get("mandatory", False)
+    )
+    max_lengths = {
+        code: spec["max_length"]
+        for code, spec in fields.items() if "max_length" in spec
+    }
+    return value_sets, mandatory, max_lengths
+
+
+@lru_cache(maxsize=1)
+def _iin_helpers():
+    """
+    IIN_JURISDICTIONS and get_iin_by_state from generate_licenses.
+
+    Imported on first use, since generate_licenses pulls in the rendering
+    dependencies, and kept so validate_iin doesn't repeat the import.
+    """
+    from generate_licenses import IIN_JURISDICTIONS, get_iin_by_state
+    return IIN_JURISDICTIONS, get_iin_by_state
+
 
 class AAMVACompliance:
     """
@@ -23,8 +83,8 @@ class AAMVACompliance:
     Based on AAMVA DL/ID Card Design Standard (2020 version).
     """
 
-    # AAMVA field specifications
-    AAMVA_FIELDS = {
+    # AAMVA field specifications, read-only; subclasses may override them
+    AAMVA_FIELDS = _freeze_fields({
         # Mandatory fields
         "DAQ": {"name": "License/ID Number", "max_length": 25, "mandatory": True},
         "DCS": {"name": "Family Name", "max_length": 40, "mandatory": True},
@@ -65,10 +125,17 @@ class AAMVACompliance:
         # Additional optional fields
         "DDK": {"name": "Organ Donor", "values": ["0", "1"], "mandatory": False},
         "DDL": {"name": "Veteran", "values": ["0", "1"], "mandatory": False},
-    }
+    })
+
+    # Enum value sets, mandatory field codes and maximum lengths, derived
+    # from AAMVA_FIELDS (see _field_tables and __init_subclass__)
+    _VALUE_SETS, _MANDATORY_FIELDS, _MAX_LENGTHS = _field_tables(AAMVA_FIELDS)
+
+    # Fields that must be filled in on a REAL ID compliant document
+    _REAL_ID_REQUIRED = ("DAQ", "DCS", "DAC", "DBB", "DAG", "DAI", "DAJ", "DAK")
 
     # Valid IIN (Issuer Identification Number) prefixes
-    VALID_IIN_PREFIXES = [
+    VALID_IIN_PREFIXES = frozenset({
         "604426", "604427", "604428", "604429", "604430", "604431", "604432", "604433", "604434",
         "636000", "636001", "636002", "636003", "636004", "636005", "636006", "636007", "636008",
         "636009", "636010", "636011", "636012", "636013", "636014", "636015", "636016", "636017",
@@ -77,11 +144,25 @@ class AAMVACompliance:
         "636037", "636038", "636039", "636040", "636041", "636042", "636043", "636044", "636045",
         "636046", "636047", "636048", "636049", "636050", "636051", "636052", "636053", "636054",
         "636055",
-    ]
+    })
 
     # Maximum barcode data length (varies by encoding, but 2D PDF417 can handle ~2700 bytes)
     MAX_BARCODE_LENGTH = 2700
 
+    # Name fields with their truncation indicator, label and barcode limit
+    _NAME_TRUNCATION_FIELDS = (
+        ("DCS", "DDE", "Family Name", 30),
+        ("DAC", "DDF", "First Name", 30),
+        ("DAD", "DDG", "Middle Name", 30),
+    )
+
+    def __init_subclass__(cls, **kwargs):
+        """Freeze and derive the field tables of subclasses that override AAMVA_FIELDS"""
+        super().__init_subclass__(**kwargs)
+        if "AAMVA_FIELDS" in cls.__dict__:
+            cls.AAMVA_FIELDS = _freeze_fields(cls.AAMVA_FIELDS)
+            cls._VALUE_SETS, cls._MANDATORY_FIELDS, cls._MAX_LENGTHS = _field_tables(cls.AAMVA_FIELDS)
+
     def __init__(self):
         self.results: List[FieldValidationResult] = []
 
@@ -96,7 +177,21 @@ class AAMVACompliance:
         Returns:
             FieldValidationResult
         """
-        if field_code not in self.AAMVA_FIELDS:
+        result = self._check_field_format(field_code, value)
+        # Results are cached and shared, so each caller gets its own copy
+        return result.model_copy(update={"suggestions": list(result.suggestions)})
+
+    @classmethod
+    @lru_cache(maxsize=8192)
+    def _check_field_format(cls, field_code: str, value: str) -> FieldValidationResult:
+        """
+        validate_field_format() without the copy, memoized.
+
+        The result depends only on the field code and value (and the class's
+        field tables, which are read-only), and batches repeat the same enum
+        codes, dates and jurisdictions, so most calls are cache hits.
+        """
+        if field_code not in cls.AAMVA_FIELDS:
             return FieldValidationResult(
                 field_name=field_code,
                 is_valid=True,
@@ -104,7 +199,7 @@ class AAMVACompliance:
                 message=f"Field {field_code} is not in AAMVA standard specification"
             )
 
-        spec = self.AAMVA_FIELDS[field_code]
+        spec = cls.AAMVA_FIELDS[field_code]
         field_name = spec["name"]
 
         # Check mandatory fields
@@ -125,8 +220,8 @@ class AAMVACompliance:
             )
 
         # Check maximum length
-        if "max_length" in spec:
-            max_len = spec["max_length"]
+        max_len = cls._MAX_LENGTHS.get(field_code)
+        if max_len is not None:
             if len(value) > max_len:
                 return FieldValidationResult(
                     field_name=field_code,
@@ -138,9 +233,10 @@ class AAMVACompliance:
                 )
 
         # Check valid values (enum)
-        if "values" in spec:
-            valid_values = spec["values"]
-            if value not in valid_values:
+        value_set = cls._VALUE_SETS.get(field_code)
+        if value_set is not None:
+            if value not in value_set:
+                valid_values = spec["values"]
                 return FieldValidationResult(
                     field_name=field_code,
                     is_valid=False,
@@ -152,7 +248,7 @@ class AAMVACompliance:
 
         # Check date format
         if "format" in spec and spec["format"] == "MMDDYYYY":
-            if not re.match(r'^\d{8}$', value):
+            if not _DATE_RE.match(value):
                 return FieldValidationResult(
                     field_name=field_code,
                     is_valid=False,
@@ -174,8 +270,9 @@ class AAMVACompliance:
                     message=f"{field_name} ({field_code}) contains invalid date: {value}"
                 )
 
-        # Check character set (should be ASCII printable for barcode)
-        if not all(32 <= ord(c) <= 126 for c in value):
+        # Check character set (should be ASCII printable for barcode);
+        # for ASCII, isprintable() accepts exactly 32-126
+        if not (value.isascii() and value.isprintable()):
             return FieldValidationResult(
                 field_name=field_code,
                 is_valid=False,
@@ -250,20 +347,15 @@ class AAMVACompliance:
             List of FieldValidationResults
         """
         results = []
+        get = data_dict.get
 
-        name_fields = [
-            ("DCS", "DDE", "Family Name", 30),
-            ("DAC", "DDF", "First Name", 30),
-            ("DAD", "DDG", "Middle Name", 30),
-        ]
-
-        for name_code, trunc_code, name_type, max_barcode_len in name_fields:
-            name_value = data_dict.get(name_code, "")
-            trunc_value = data_dict.get(trunc_code, "N")
-
+        for name_code, trunc_code, name_type, max_barcode_len in self._NAME_TRUNCATION_FIELDS:
+            name_value = get(name_code)
             if not name_value:
                 continue
 
+            trunc_value = get(trunc_code, "N")
+
             name_len = len(name_value)
 
             # Check if truncation flag is appropriate
@@ -299,7 +391,7 @@ class AAMVACompliance:
         Returns:
             FieldValidationResult
         """
-        from generate_licenses import IIN_JURISDICTIONS, get_iin_by_state
+        IIN_JURISDICTIONS, get_iin_by_state = _iin_helpers()
 
         iin = get_iin_by_state(state_code)
 
@@ -353,8 +445,7 @@ class AAMVACompliance:
             ))
 
             # Check that required fields are present for REAL ID
-            required_for_real_id = ["DAQ", "DCS", "DAC", "DBB", "DAG", "DAI", "DAJ", "DAK"]
-            missing_fields = [f for f in required_for_real_id if not data_dict.get(f)]
+            missing_fields = [f for f in self._REAL_ID_REQUIRED if not data_dict.get(f)]
 
             if missing_fields:
                 results.append(FieldValidationResult(
@@ -395,13 +486,14 @@ class AAMVACompliance:
                 result.is_valid = False
 
         # Check mandatory fields are present
-        for field_code, spec in self.AAMVA_FIELDS.items():
-            if spec.get("mandatory", False) and field_code not in data_dict:
+        for field_code in self._MANDATORY_FIELDS:
+            if field_code not in data_dict:
                 result.add_result(FieldValidationResult(
                     field_name=field_code,
                     is_valid=False,
                     level=ValidationLevel.ERROR,
-                    message=f"Mandatory field {spec['name']} ({field_code}) is missing"
+                    message=f"Mandatory field {self.AAMVA_FIELDS[field_code]['name']} "
+                            f"({field_code}) is missing"
                 ))
                 result.is_valid = False
 
@@ -0,0 +1,74 @@
+"""
+Unit tests for AAMVA field format compliance checks.
+
+Field checks are memoized per class, so the field tables they read must be
+fixed for each class and the results handed out must not be shared.
+"""
+
+import pytest
+
+from aamva_license_generator.validation.aamva_compliance import AAMVACompliance
+
+pytestmark = pytest.mark.unit
+
+
+class TestFieldTables:
+    """Tests for the field specification tables."""
+
+    def test_fields_are_read_only(self):
+        """AAMVA_FIELDS and its specifications cannot be modified in place."""
+        with pytest.raises(TypeError):
+            AAMVACompliance.AAMVA_FIELDS["DXX"] = {"name": "New"}
+        with pytest.raises(TypeError):
+            AAMVACompliance.AAMVA_FIELDS["DBC"]["values"] = ["X"]
+        with pytest.raises(AttributeError):
+            AAMVACompliance.AAMVA_FIELDS["DBC"]["values"].append("X")
+
+    def test_subclass_fields_are_used(self):
+        """A subclass overriding AAMVA_FIELDS is checked against its own tables."""
+        fields = dict(AAMVACompliance.AAMVA_FIELDS)
+        fields["DBC"] = {"name": "Sex", "values": ["M", "F", "X"], "mandatory": True}
+        fields["DAJ"] = {"name": "Jurisdiction Code", "max_length": 3, "mandatory": True}
+        del fields["DAQ"]
+
+        class Custom(AAMVACompliance):
+            AAMVA_FIELDS = fields
+
+        base, custom = AAMVACompliance(), Custom()
+
+        # Check the base class first so its results are cached
+        assert base.validate_field_format("DBC", "X").is_valid is False
+        assert base.validate_field_format("DAJ", "ABC").is_valid is False
+        assert custom.validate_field_format("DBC", "X").is_valid is True
+        assert custom.validate_field_format("DBC", "1").suggestions == ["M", "F", "X"]
+        assert custom.validate_field_format("DAJ", "ABC").is_valid is True
+        assert "DAQ" not in Custom._MANDATORY_FIELDS
+
+        # The subclass's copy is frozen; the caller's dict is left alone
+        with pytest.raises(TypeError):
+            Custom.AAMVA_FIELDS["DBC"] = {}
+        fields["DBC"] = {"name": "Sex", "values": ["1"], "mandatory": True}
+        assert custom.validate_field_format("DBC", "X").is_valid is True
+
+        # The base class is unaffected
+        assert base.validate_field_format("DBC", "X").is_valid is False
+        assert base.validate_field_format("DBC", "1").is_valid is True
+
+
+class TestValidateFieldFormat:
+    """Tests for results returned by validate_field_format."""
+
+    def test_suggestions_are_not_shared(self):
+        """Each call returns its own suggestions list, even on a cache hit."""
+        validator = AAMVACompliance()
+        first = validator.validate_field_format("DAY", "PURPLE")
+        expected = list(first.suggestions)
+        assert "BLU" in expected
+
+        first.suggestions.append("PURPLE")
+        first.suggestions.remove("BLU")
+
+        second = validator.validate_field_format("DAY", "PURPLE")
+        assert second.suggestions == expected
+        assert second.suggestions is not first.suggestions
+        assert isinstance(second.suggestions, list)
@@ -0,0 +1,60 @@
+"""
+Unit tests for the built-in template library.
+
+Built-in templates are built once and cached; every lookup must still hand
+out an independent template with its own timestamps.
+"""
+
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aamva_license_generator.templates.builtin_templates import (
+    get_builtin_template,
+    get_builtin_templates,
+    list_builtin_template_names,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class TestGetBuiltinTemplate:
+    """Tests for copies returned by get_builtin_template."""
+
+    def test_copies_are_independent(self):
+        """Modifying one copy does not affect the next lookup."""
+        name = list_builtin_template_names()[0]
+        first = get_builtin_template(name)
+        first.parameters['quantity'] = -1
+        first.metadata['note'] = 'modified'
+
+        second = get_builtin_template(name)
+        assert second.parameters.get('quantity') != -1
+        assert 'note' not in second.metadata
+
+    def test_each_copy_gets_its_own_timestamps(self):
+        """Each lookup is stamped when it is made, not when the cache was filled."""
+        name = list_builtin_template_names()[0]
+        first = get_builtin_template(name)
+        time.sleep(0.01)
+        second = get_builtin_template(name)
+
+        assert second.metadata['created_at'] > first.metadata['created_at']
+        assert second.metadata['updated_at'] == second.metadata['created_at']
+
+    def test_mapping_lookup_is_stamped(self):
+        """Lookups through get_builtin_templates() are stamped too."""
+        name = list_builtin_template_names()[0]
+        first = get_builtin_templates()[name]
+        time.sleep(0.01)
+        assert get_builtin_templates()[name].metadata['created_at'] > first.metadata['created_at']
+
+    def test_timestamps_are_naive_utc(self):
+        """Copies are stamped in the naive UTC ISO format used for all template metadata."""
+        template = get_builtin_template(list_builtin_template_names()[0])
+        stamped = datetime.fromisoformat(template.metadata['created_at'])
+
+        assert stamped.tzinfo is None
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        assert abs(now - stamped) < timedelta(minutes=1)
@@ -0,0 +1,117 @@
+"""
+Unit tests for the undo/redo command history.
+
+Commands dropped from the history (evicted past max_history or discarded
+from the redo stack) may still be referenced by callers, macros or UI
+code, and must stay usable.
+"""
+
+import pytest
+
+from aamva_license_generator.commands import (
+    CommandHistory,
+    FunctionCommand,
+    MacroCommand,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _setter(values, key, value):
+    """Command callback that records a value"""
+    def set_value():
+        values[key] = value
+        return True
+    return set_value
+
+
+def _make_command(values, i):
+    return FunctionCommand(
+        execute_fn=_setter(values, i, 'done'),
+        undo_fn=_setter(values, i, 'undone'),
+        description=f"Command {i}"
+    )
+
+
+class TestDroppedCommandsStayIntact:
+    """Tests that the history never reuses commands it no longer holds."""
+
+    def test_evicted_commands_keep_their_callbacks(self):
+        """Commands evicted past max_history are untouched and still run."""
+        history = CommandHistory(max_history=3)
+        history.disable_merging()
+        values = {}
+        commands = [_make_command(values, i) for i in range(6)]
+
+        for command in commands:
+            assert history.execute(command)
+
+        assert history.get_undo_count() == 3
+        for i, command in enumerate(commands[:3]):
+            assert command.description == f"Command {i}"
+            assert command.undo()
+            assert values[i] == 'undone'
+            assert command.execute()
+            assert values[i] == 'done'
+
+        # Later commands are distinct objects, not reinitialised evictees
+        assert len({id(c) for c in commands}) == len(commands)
+
+    def test_cleared_redo_commands_keep_their_callbacks(self):
+        """Commands discarded from the redo stack can still be redone by their holders."""
+        history = CommandHistory(max_history=3)
+        history.disable_merging()
+        values = {}
+        commands = [_make_command(values, i) for i in range(3)]
+        for command in commands:
+            history.execute(command)
+
+        assert history.undo() and history.undo()
+        assert history.get_redo_count() == 2
+
+        # A new command discards the redo stack
+        history.execute(_make_command(values, 99))
+        assert history.get_redo_count() == 0
+
+        for i in (1, 2):
+            assert commands[i].description == f"Command {i}"
+            assert commands[i].redo()
+            assert values[i] == 'done'
+
+    def test_macro_children_survive_eviction(self):
+        """A macro evicted from the history can still undo its children."""
+        history = CommandHistory(max_history=2)
+        history.disable_merging()
+        values = {}
+        children = [_make_command(values, i) for i in range(2)]
+        macro = MacroCommand(children, description="Macro")
+        history.execute(macro)
+
+        for i in range(10, 14):
+            history.execute(_make_command(values, i))
+
+        assert macro.undo()
+        assert values[0] == values[1] == 'undone'
+
+    def test_app_state_undo_commands_are_not_reused(self, tmp_path, monkeypatch):
+        """A held AppState undo command keeps its description after eviction."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        from aamva_license_generator.state.app_state import AppState
+
+        state = AppState(config_dir=tmp_path / 'state')
+        state.disable_auto_save()
+        state.commands = CommandHistory(max_history=3)
+        state.commands.disable_merging()
+
+        original = state.get_config().quantity
+        state.set_quantity(original + 1)
+        held = state.commands._undo_stack[-1]
+        description = held.description
+
+        for quantity in range(original + 2, original + 12):
+            state.set_quantity(quantity)
+
+        assert held not in state.commands._undo_stack
+        assert held.description == description
+        assert held.undo()
+        assert state.get_config().quantity == original
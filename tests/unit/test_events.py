@@ -0,0 +1,232 @@
+"""
+Unit tests for the event bus.
+
+Covers coalesced (debounced) delivery and its interaction with AppState,
+whose setters emit while holding their own lock.
+"""
+
+import threading
+import time
+
+import pytest
+
+from aamva_license_generator.events import (
+    Event,
+    EventBus,
+    EventType,
+    get_event_bus,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _wait_for(predicate, timeout=2.0):
+    """Poll until predicate() is true or the timeout expires"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestCoalescedDelivery:
+    """Tests for EventBus.emit_coalesced and flush_coalesced."""
+
+    def test_burst_is_merged_into_one_event(self):
+        """Events emitted within the debounce window arrive as one merged event."""
+        bus = EventBus()
+        received = []
+        immediate = []
+
+        # Handlers are held weakly, so keep named references
+        def on_coalesced(event):
+            received.append(event)
+
+        def on_event(event):
+            immediate.append(event)
+
+        bus.subscribe(EventType.STATE_CHANGED, on_coalesced, coalesce=True)
+        bus.subscribe(EventType.STATE_CHANGED, on_event)
+
+        for i in range(5):
+            bus.emit_coalesced(
+                Event(EventType.STATE_CHANGED, source=self, data={'n': i, f'k{i}': i}),
+                debounce_ms=50
+            )
+
+        # Regular handlers are not debounced
+        assert len(immediate) == 5
+
+        assert _wait_for(lambda: received)
+        time.sleep(0.1)
+        assert len(received) == 1
+        assert received[0].data['n'] == 4
+        assert all(received[0].data[f'k{i}'] == i for i in range(5))
+
+    def test_keys_are_debounced_separately(self):
+        """Each coalescing key gets its own merged event."""
+        bus = EventBus()
+        received = []
+
+        def on_coalesced(event):
+            received.append(event)
+
+        bus.subscribe(EventType.STATE_CHANGED, on_coalesced, coalesce=True)
+
+        bus.emit_coalesced(Event(EventType.STATE_CHANGED, source=self, data={'a': 1}),
+                           key='a', debounce_ms=10)
+        bus.emit_coalesced(Event(EventType.STATE_CHANGED, source=self, data={'b': 2}),
+                           key='b', debounce_ms=10)
+
+        assert _wait_for(lambda: len(received) == 2)
+        assert sorted(tuple(e.data) for e in received) == [('a',), ('b',)]
+
+    def test_flush_delivers_on_calling_thread(self):
+        """flush_coalesced delivers pending events immediately, on the caller's thread."""
+        bus = EventBus()
+        threads = []
+
+        def on_coalesced(event):
+            threads.append(threading.current_thread())
+
+        bus.subscribe(EventType.STATE_CHANGED, on_coalesced, coalesce=True)
+
+        bus.emit_coalesced(Event(EventType.STATE_CHANGED, source=self), debounce_ms=10_000)
+        assert threads == []
+
+        bus.flush_coalesced()
+        assert threads == [threading.current_thread()]
+
+        # Nothing is left to deliver later
+        time.sleep(0.05)
+        assert len(threads) == 1
+
+    def test_one_worker_serves_a_burst(self, monkeypatch):
+        """A burst of emits does not start a thread per emit."""
+        bus = EventBus()
+        started = []
+        original_start = threading.Thread.start
+
+        def counting_start(thread):
+            started.append(thread)
+            original_start(thread)
+
+        monkeypatch.setattr(threading.Thread, 'start', counting_start)
+
+        def on_coalesced(event):
+            pass
+
+        bus.subscribe(EventType.STATE_CHANGED, on_coalesced, coalesce=True)
+
+        for i in range(50):
+            bus.emit_coalesced(Event(EventType.STATE_CHANGED, source=self, data={'n': i}),
+                               debounce_ms=50)
+
+        assert len(started) == 1
+        bus.flush_coalesced()
+
+    def test_handler_can_reenter_app_state(self, tmp_path, monkeypatch):
+        """
+        A coalescing handler that reads AppState must not deadlock against
+        a setter that emits while holding the AppState lock.
+        """
+        monkeypatch.setenv('HOME', str(tmp_path))
+        from aamva_license_generator.state.app_state import AppState
+
+        state = AppState(config_dir=tmp_path / 'state')
+        state.disable_auto_save()
+        bus = get_event_bus()
+        handler_started = threading.Event()
+        seen = []
+
+        def on_change(event):
+            handler_started.set()
+            seen.append(state.get_config().quantity)
+
+        def write():
+            # Hold the AppState lock while the coalesced handler runs,
+            # then emit from a setter
+            with state._lock:
+                handler_started.wait(timeout=5)
+                state.set_quantity(2, create_command=False)
+
+        handler = bus.subscribe(EventType.STATE_CHANGED, on_change, coalesce=True)
+        try:
+            bus.emit_coalesced(Event(EventType.STATE_CHANGED, source=state), debounce_ms=50)
+
+            writer = threading.Thread(target=write, daemon=True)
+            writer.start()
+            writer.join(timeout=10)
+            assert not writer.is_alive(), "AppState setter deadlocked with coalesced delivery"
+
+            bus.flush_coalesced()
+            assert _wait_for(lambda: 2 in seen)
+        finally:
+            bus.unsubscribe(EventType.STATE_CHANGED, handler)
+
+
+class TestSubscriberCheck:
+    """Tests for has_subscribers and the emit skip it enables."""
+
+    def test_reflects_subscriptions(self):
+        """has_subscribers follows subscribe and unsubscribe."""
+        bus = EventBus()
+
+        def on_event(event):
+            pass
+
+        assert not bus.has_subscribers(EventType.STATE_CHANGED)
+        handler = bus.subscribe(EventType.STATE_CHANGED, on_event)
+        assert bus.has_subscribers(EventType.STATE_CHANGED)
+        bus.unsubscribe(EventType.STATE_CHANGED, handler)
+        assert not bus.has_subscribers(EventType.STATE_CHANGED)
+
+    def test_true_while_batching(self):
+        """Queued events may reach later subscribers, so batching counts as subscribed."""
+        bus = EventBus()
+        bus.start_batch()
+        assert bus.has_subscribers(EventType.STATE_CHANGED)
+        bus.end_batch()
+        assert not bus.has_subscribers(EventType.STATE_CHANGED)
+
+    def test_app_state_skips_unobserved_changes(self, tmp_path, monkeypatch):
+        """AppState does not emit STATE_CHANGED when nothing is subscribed."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        from aamva_license_generator.state.app_state import AppState
+
+        state = AppState(config_dir=tmp_path / 'state')
+        state.disable_auto_save()
+        bus = get_event_bus()
+        if bus.has_subscribers(EventType.STATE_CHANGED):
+            pytest.skip("global bus already has STATE_CHANGED subscribers")
+
+        before = bus.get_statistics()['event_counts'].get(EventType.STATE_CHANGED, 0)
+        state.set_quantity(7, create_command=False)
+        after = bus.get_statistics()['event_counts'].get(EventType.STATE_CHANGED, 0)
+        assert after == before
+
+    def test_app_state_change_in_batch_reaches_later_subscriber(self, tmp_path, monkeypatch):
+        """A change made during a batch is replayed to handlers subscribed before it ends."""
+        monkeypatch.setenv('HOME', str(tmp_path))
+        from aamva_license_generator.state.app_state import AppState
+
+        state = AppState(config_dir=tmp_path / 'state')
+        state.disable_auto_save()
+        bus = get_event_bus()
+        received = []
+
+        def on_change(event):
+            received.append(event.data)
+
+        bus.start_batch()
+        try:
+            state.set_quantity(11, create_command=False)
+            handler = bus.subscribe(EventType.STATE_CHANGED, on_change)
+        finally:
+            bus.end_batch()
+
+        try:
+            assert {'field': 'quantity', 'value': 11} in received
+        finally:
+            bus.unsubscribe(EventType.STATE_CHANGED, handler)
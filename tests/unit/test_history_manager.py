@@ -0,0 +1,133 @@
+"""
+Unit tests for generation history.
+
+History is kept oldest-first in memory and served newest-first, so entries
+added or imported out of order must land in chronological position.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from aamva_license_generator.state.history_manager import HistoryEntry, HistoryManager
+
+pytestmark = pytest.mark.unit
+
+BASE_TIME = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def _entry(minutes, state_code="CA", success=True):
+    """History entry stamped minutes after BASE_TIME"""
+    return HistoryEntry(
+        timestamp=BASE_TIME + timedelta(minutes=minutes),
+        state_code=state_code,
+        total_count=10,
+        completed_count=10 if success else 0,
+        failed_count=0 if success else 10,
+        skipped_count=0,
+        duration=1.0,
+        output_directory="/tmp/output",
+        success=success,
+    )
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """History manager with an empty config directory and no auto-save"""
+    manager = HistoryManager(max_entries=5, config_dir=tmp_path)
+    manager.disable_auto_save()
+    return manager
+
+
+def _minutes(entries):
+    return [int((e.timestamp - BASE_TIME).total_seconds() // 60) for e in entries]
+
+
+class TestChronologicalOrder:
+    """Tests for out-of-order additions."""
+
+    def test_out_of_order_entries_are_inserted_in_place(self, manager):
+        """Entries added out of order are served newest first."""
+        for minutes in (10, 30, 20, 0, 25):
+            manager.add_entry(_entry(minutes))
+
+        assert _minutes(manager.get_entries()) == [30, 25, 20, 10, 0]
+        assert _minutes([manager.get_latest()]) == [30]
+
+    def test_equal_timestamps_keep_insertion_order(self, manager):
+        """An out-of-order entry goes after existing entries with the same time."""
+        first = _entry(10, state_code="CA")
+        manager.add_entry(first)
+        manager.add_entry(_entry(20))
+        second = _entry(10, state_code="NY")
+        manager.add_entry(second)
+
+        entries = manager.get_entries()
+        assert entries[1] is second
+        assert entries[2] is first
+
+    def test_full_history_drops_the_oldest(self, manager):
+        """When full, an out-of-order entry evicts the oldest entry."""
+        for minutes in (10, 20, 30, 40, 50):
+            manager.add_entry(_entry(minutes))
+
+        manager.add_entry(_entry(35))
+        assert _minutes(manager.get_entries()) == [50, 40, 35, 30, 20]
+
+        # Older than everything kept: dropped, as it would be evicted at once
+        manager.add_entry(_entry(5))
+        assert _minutes(manager.get_entries()) == [50, 40, 35, 30, 20]
+
+
+class TestGetEntries:
+    """Tests for get_entries filtering and limits."""
+
+    def test_filters_and_limit(self, manager):
+        """Filters combine, and limit keeps the newest matches."""
+        manager.add_entry(_entry(0, "CA"))
+        manager.add_entry(_entry(10, "NY"))
+        manager.add_entry(_entry(20, "CA", success=False))
+        manager.add_entry(_entry(30, "CA"))
+        manager.add_entry(_entry(40, "NY"))
+
+        assert _minutes(manager.get_entries(state_code="CA")) == [30, 20, 0]
+        assert _minutes(manager.get_entries(state_code="CA", success_only=True)) == [30, 0]
+        assert _minutes(manager.get_entries(limit=2)) == [40, 30]
+        assert _minutes(manager.get_entries(state_code="NY", limit=1)) == [40]
+
+        since = BASE_TIME + timedelta(minutes=10)
+        assert _minutes(manager.get_entries(since=since)) == [40, 30, 20, 10]
+        assert _minutes(manager.get_entries(since=since, success_only=True, limit=2)) == [40, 30]
+
+    def test_returns_a_copy(self, manager):
+        """The returned list is independent of the stored history."""
+        manager.add_entry(_entry(0))
+        manager.get_entries().clear()
+        assert manager.get_entry_count() == 1
+
+
+class TestImport:
+    """Tests for importing history files."""
+
+    def test_import_sorts_entries(self, manager, tmp_path):
+        """Imported entries are sorted, whatever order the file lists them in."""
+        path = tmp_path / "import.json"
+        entries = [_entry(m).to_dict() for m in (30, 0, 20, 10)]
+        path.write_text(json.dumps({'entries': entries}))
+
+        assert manager.import_from_file(path)
+        assert _minutes(manager.get_entries()) == [30, 20, 10, 0]
+
+        # Later additions stay in order with the imported entries
+        manager.add_entry(_entry(15))
+        assert _minutes(manager.get_entries()) == [30, 20, 15, 10, 0]
+
+    def test_import_keeps_the_newest_entries(self, manager, tmp_path):
+        """An import larger than max_entries keeps the newest entries."""
+        path = tmp_path / "import.json"
+        entries = [_entry(m).to_dict() for m in (60, 0, 50, 10, 40, 20, 30)]
+        path.write_text(json.dumps({'entries': entries}))
+
+        assert manager.import_from_file(path)
+        assert _minutes(manager.get_entries()) == [60, 50, 40, 30, 20]
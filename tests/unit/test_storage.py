@@ -0,0 +1,281 @@
+"""
+Unit tests for the storage layer.
+
+Covers the platform-specific fast paths (O_TMPFILE temp files, preallocation,
+memory-mapped hashing, in-kernel copies) against their portable fallbacks:
+both must produce the same files and checksums.
+"""
+
+import errno
+import hashlib
+import os
+
+import pytest
+
+from aamva_license_generator import storage
+from aamva_license_generator.storage import (
+    SafeFileOperations,
+    StorageError,
+    TemporaryFileManager,
+)
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture(params=[True, False], ids=['o_tmpfile', 'named_temp'])
+def anonymous_temp(request, monkeypatch):
+    """Run with and without O_TMPFILE temp files"""
+    if request.param and not storage.ANONYMOUS_TEMP_SUPPORTED:
+        pytest.skip("O_TMPFILE not supported on this platform")
+    monkeypatch.setattr(storage, 'ANONYMOUS_TEMP_SUPPORTED', request.param)
+    return request.param
+
+
+@pytest.fixture
+def reject_o_tmpfile(monkeypatch):
+    """Make O_TMPFILE opens fail as on a filesystem without support"""
+    if not storage.ANONYMOUS_TEMP_SUPPORTED:
+        pytest.skip("O_TMPFILE not supported on this platform")
+
+    real_open = os.open
+
+    def fake_open(path, flags, *args, **kwargs):
+        if flags & os.O_TMPFILE == os.O_TMPFILE:
+            raise OSError(errno.EOPNOTSUPP, "O_TMPFILE not supported")
+        return real_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(os, 'open', fake_open)
+
+
+def _leftovers(directory, keep):
+    """Files in directory other than keep (e.g. stray temp files)"""
+    return sorted(name for name in os.listdir(directory) if name not in keep)
+
+
+class TestAtomicWrite:
+    """Tests for atomic_write and atomic_write_at."""
+
+    def test_creates_and_replaces(self, tmp_path, anonymous_temp):
+        """New files are created and existing ones replaced, with no temp files left."""
+        target = tmp_path / 'out.txt'
+
+        with SafeFileOperations.atomic_write(target) as f:
+            f.write('first')
+        assert target.read_text() == 'first'
+
+        with SafeFileOperations.atomic_write(target, 'wb') as f:
+            f.write(b'second')
+        assert target.read_bytes() == b'second'
+
+        assert _leftovers(tmp_path, {'out.txt'}) == []
+
+    def test_falls_back_when_o_tmpfile_unsupported(self, tmp_path, reject_o_tmpfile):
+        """A filesystem rejecting O_TMPFILE gets a named temp file instead."""
+        target = tmp_path / 'out.txt'
+        target.write_text('old')
+
+        with SafeFileOperations.atomic_write(target) as f:
+            f.write('new')
+
+        assert target.read_text() == 'new'
+        assert _leftovers(tmp_path, {'out.txt'}) == []
+
+    def test_failed_write_keeps_original(self, tmp_path, anonymous_temp):
+        """An exception while writing leaves the original file and no temp file."""
+        target = tmp_path / 'out.txt'
+        target.write_text('original')
+
+        with pytest.raises(StorageError):
+            with SafeFileOperations.atomic_write(target) as f:
+                f.write('partial')
+                raise RuntimeError("write failed")
+
+        assert target.read_text() == 'original'
+        assert _leftovers(tmp_path, {'out.txt'}) == []
+
+    def test_preallocated_file_is_truncated(self, tmp_path, anonymous_temp):
+        """Space preallocated for expected_size is released after a short write."""
+        target = tmp_path / 'out.bin'
+
+        with SafeFileOperations.atomic_write(
+            target, 'wb', expected_size=storage.PREALLOCATE_MIN_SIZE * 2
+        ) as f:
+            f.write(b'x' * 10)
+
+        assert target.stat().st_size == 10
+
+    @pytest.mark.parametrize('reject', [False, True], ids=['default', 'no_o_tmpfile'])
+    def test_atomic_write_at(self, tmp_path, request, reject):
+        """Writes through a directory handle replace files, with or without O_TMPFILE."""
+        if reject:
+            request.getfixturevalue('reject_o_tmpfile')
+        (tmp_path / 'a.txt').write_text('old')
+
+        with SafeFileOperations.open_dir(tmp_path) as out:
+            for name in ('a.txt', 'b.txt'):
+                with SafeFileOperations.atomic_write_at(out, name) as f:
+                    f.write(f'new {name}')
+
+        assert (tmp_path / 'a.txt').read_text() == 'new a.txt'
+        assert (tmp_path / 'b.txt').read_text() == 'new b.txt'
+        assert _leftovers(tmp_path, {'a.txt', 'b.txt'}) == []
+
+
+class TestChecksum:
+    """Tests that every hashing path agrees with hashlib."""
+
+    SIZES = [0, 1, 4096 * 3 + 5, storage.CHECKSUM_CHUNK_SIZE + 7]
+
+    @pytest.fixture
+    def small_windows(self, monkeypatch):
+        """Hash memory maps in several small windows"""
+        monkeypatch.setattr(storage, 'MMAP_WINDOW_SIZE', 4096)
+
+    @pytest.fixture
+    def no_mmap(self, monkeypatch):
+        """Force the read-based paths"""
+        def fail(hasher, fd, size):
+            raise OSError(errno.ENODEV, "not mappable")
+        monkeypatch.setattr(SafeFileOperations, '_update_from_mmap', staticmethod(fail))
+
+    def _file(self, tmp_path, size):
+        data = os.urandom(size)
+        path = tmp_path / f'data_{size}.bin'
+        path.write_bytes(data)
+        return path, data
+
+    @pytest.mark.parametrize('size', SIZES)
+    @pytest.mark.parametrize('algorithm', ['sha256', 'md5'])
+    def test_mmap_path(self, tmp_path, small_windows, size, algorithm):
+        """Hashing a memory map window by window matches hashlib."""
+        path, data = self._file(tmp_path, size)
+        expected = hashlib.new(algorithm, data).hexdigest()
+        assert SafeFileOperations.calculate_checksum(path, algorithm) == expected
+
+    @pytest.mark.parametrize('size', SIZES)
+    def test_file_digest_path(self, tmp_path, no_mmap, size):
+        """hashlib.file_digest, used for unmappable files, gives the same checksum."""
+        if not hasattr(hashlib, 'file_digest'):
+            pytest.skip("hashlib.file_digest needs Python 3.11")
+        path, data = self._file(tmp_path, size)
+        assert SafeFileOperations.calculate_checksum(path) == hashlib.sha256(data).hexdigest()
+
+    @pytest.mark.parametrize('size', SIZES)
+    def test_read_loop_path(self, tmp_path, no_mmap, monkeypatch, size):
+        """The chunked read loop (Python < 3.11) gives the same checksum."""
+        monkeypatch.delattr(hashlib, 'file_digest', raising=False)
+        path, data = self._file(tmp_path, size)
+        assert SafeFileOperations.calculate_checksum(path) == hashlib.sha256(data).hexdigest()
+
+    def test_copy_with_hash_matches(self, tmp_path):
+        """The single-pass copy hash equals the checksum of the copy."""
+        path, data = self._file(tmp_path, storage.CHECKSUM_CHUNK_SIZE + 7)
+        copy = tmp_path / 'copy.bin'
+
+        checksum = SafeFileOperations._copy_with_hash(path, copy)
+
+        assert checksum == hashlib.sha256(data).hexdigest()
+        assert checksum == SafeFileOperations.calculate_checksum(copy)
+
+
+class TestCopy:
+    """Tests for in-kernel copies and their fallbacks."""
+
+    def _unsupported(self, src_fd, dst_fd, count):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    @pytest.mark.parametrize('mechanism', ['kernel', 'unsupported_kernel', 'read_write'])
+    def test_copy_with_progress(self, tmp_path, monkeypatch, mechanism):
+        """Each copy mechanism produces an identical file and reports progress."""
+        if mechanism == 'unsupported_kernel':
+            monkeypatch.setattr(storage, '_KERNEL_COPY_FUNCTIONS', (self._unsupported,))
+        elif mechanism == 'read_write':
+            monkeypatch.setattr(storage, '_KERNEL_COPY_FUNCTIONS', ())
+        monkeypatch.setattr(storage, 'COPY_SLICE_SIZE', 64 << 10)
+
+        data = os.urandom((64 << 10) * 3 + 11)
+        src = tmp_path / 'src.bin'
+        src.write_bytes(data)
+        dst = tmp_path / 'dst.bin'
+        progress = []
+
+        def on_progress(done, total):
+            progress.append((done, total))
+
+        SafeFileOperations.safe_copy(src, dst, progress_callback=on_progress)
+
+        assert dst.read_bytes() == data
+        assert progress[-1] == (len(data), len(data))
+
+    def test_verified_copy(self, tmp_path):
+        """A verified copy matches its source."""
+        data = os.urandom(100_000)
+        src = tmp_path / 'src.bin'
+        src.write_bytes(data)
+        dst = tmp_path / 'dst.bin'
+
+        SafeFileOperations.safe_copy(src, dst, verify=True)
+
+        assert dst.read_bytes() == data
+
+
+class TestTemporaryFiles:
+    """Tests for where TemporaryFileManager creates temporary files."""
+
+    @pytest.fixture
+    def fake_tmpfs(self, tmp_path, monkeypatch):
+        """A writable directory standing in for /dev/shm"""
+        tmpfs = tmp_path / 'shm'
+        tmpfs.mkdir()
+        monkeypatch.setattr(storage, '_usable_tmpfs_dir', lambda: str(tmpfs))
+        return tmpfs
+
+    @pytest.fixture
+    def tempdir(self, tmp_path, monkeypatch):
+        """TMPDIR pointing at a directory of its own"""
+        tempdir = tmp_path / 'tmp'
+        tempdir.mkdir()
+        monkeypatch.setenv('TMPDIR', str(tempdir))
+        monkeypatch.setattr(storage.tempfile, 'tempdir', None)
+        return tempdir
+
+    def test_default_uses_tempfile_location(self, fake_tmpfs, tempdir):
+        """By default temporary files go where tempfile puts them, not tmpfs."""
+        with TemporaryFileManager.temporary_file() as (f, path):
+            assert path.parent == tempdir
+        with TemporaryFileManager.temporary_directory() as path:
+            assert path.parent == tempdir
+        assert list(fake_tmpfs.iterdir()) == []
+
+    def test_tmpdir_overrides_prefer_tmpfs(self, fake_tmpfs, tempdir):
+        """A TMPDIR set by the user wins over prefer_tmpfs."""
+        with TemporaryFileManager.temporary_file(prefer_tmpfs=True) as (f, path):
+            assert path.parent == tempdir
+
+    def test_prefer_tmpfs_without_tmpdir(self, fake_tmpfs, monkeypatch):
+        """With TMPDIR unset, prefer_tmpfs uses tmpfs."""
+        monkeypatch.delenv('TMPDIR', raising=False)
+        with TemporaryFileManager.temporary_file(prefer_tmpfs=True) as (f, path):
+            assert path.parent == fake_tmpfs
+        with TemporaryFileManager.temporary_directory(prefer_tmpfs=True) as path:
+            assert path.parent == fake_tmpfs
+
+    def test_destination_keeps_same_filesystem(self, tmp_path, fake_tmpfs, monkeypatch):
+        """tmpfs on another device gives way to the destination directory."""
+        monkeypatch.delenv('TMPDIR', raising=False)
+        destination = tmp_path / 'out'
+        destination.mkdir()
+        real_stat = os.stat
+
+        def stat(path, *args, **kwargs):
+            st = real_stat(path, *args, **kwargs)
+            if os.fspath(path) == str(fake_tmpfs):
+                return os.stat_result((st.st_mode, st.st_ino, st.st_dev + 1) + tuple(st)[3:])
+            return st
+
+        monkeypatch.setattr(os, 'stat', stat)
+
+        with TemporaryFileManager.temporary_file(
+            prefer_tmpfs=True, destination=destination
+        ) as (f, path):
+            assert path.parent == destination
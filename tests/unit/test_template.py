@@ -0,0 +1,69 @@
+"""
+Unit tests for Template.
+
+Placeholders are ${NAME}; there is no escape syntax, unknown names are left
+as written, and substitution is a single pass. Summaries are built on every
+call, so they follow fields modified in place.
+"""
+
+import pytest
+
+from aamva_license_generator.templates.template import Template
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def template():
+    return Template(
+        name='subst',
+        description='Substitution test',
+        variables={'STATE': 'CA', 'COUNT': 5, 'LOOP': '${STATE}'},
+    )
+
+
+class TestSubstituteVariables:
+    """Edge cases of Template.substitute_variables."""
+
+    @pytest.mark.parametrize('text, expected', [
+        ('no placeholders', 'no placeholders'),
+        ('${STATE}', 'CA'),
+        ('${STATE}${COUNT}', 'CA5'),
+        ('${STATE}-${STATE}', 'CA-CA'),
+        ('$${STATE}', '$CA'),
+        ('${UNKNOWN}', '${UNKNOWN}'),
+        ('${STATE}${UNKNOWN}${COUNT}', 'CA${UNKNOWN}5'),
+        ('${}', '${}'),
+        ('${STATE', '${STATE'),
+        ('$STATE {STATE}', '$STATE {STATE}'),
+        ('${${STATE}}', '${${STATE}}'),
+    ])
+    def test_placeholders(self, template, text, expected):
+        assert template.substitute_variables(text) == expected
+
+    def test_values_are_not_substituted_again(self, template):
+        """A value that contains a placeholder is inserted as written."""
+        assert template.substitute_variables('${LOOP}') == '${STATE}'
+
+    def test_additional_vars_override(self, template):
+        """Additional variables take precedence and can add new names."""
+        text = '${STATE} ${EXTRA}'
+        assert template.substitute_variables(text, {'STATE': 'NY', 'EXTRA': 1}) == 'NY 1'
+        # The template's own variables are unchanged
+        assert template.variables['STATE'] == 'CA'
+        assert 'EXTRA' not in template.variables
+
+
+class TestSummary:
+    """Tests for Template.get_summary."""
+
+    def test_reflects_changes(self, template):
+        """The summary follows assigned and in-place modified fields."""
+        template.parameters['states'] = ['CA']
+        assert "states: ['CA']" in template.get_summary()
+
+        template.parameters['states'].append('NY')
+        assert "states: ['CA', 'NY']" in template.get_summary()
+
+        template.description = 'Changed'
+        assert 'Description: Changed' in repr(template)
@@ -0,0 +1,220 @@
+"""
+Unit tests for the template manager.
+
+Covers the persistent index of user templates, which must notice edits to
+template files, and inheritance resolution, which must report cycles.
+"""
+
+import json
+import os
+
+import pytest
+
+from aamva_license_generator.templates.template import Template
+from aamva_license_generator.templates.template_manager import (
+    INDEX_FILENAME,
+    TemplateManager,
+)
+from aamva_license_generator.templates.template_validator import ValidationError
+
+pytestmark = pytest.mark.unit
+
+
+def _write_template(directory, name, parent=None, tags=None):
+    """Write a template file directly, bypassing save() and its checks"""
+    template = Template(
+        name=name,
+        description=f"Template {name}",
+        tags=tags or [],
+        parent_template=parent,
+    )
+    path = directory / f"{name}.json"
+    path.write_text(json.dumps(template.to_dict()))
+    return path
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return TemplateManager(templates_dir=tmp_path)
+
+
+class TestIndex:
+    """Tests for the user template index."""
+
+    def test_index_is_persisted(self, tmp_path, manager):
+        """Listing by tag writes an index that a new manager reuses."""
+        _write_template(tmp_path, 'a', tags=['one'])
+
+        assert manager.list_templates(include_builtin=False, tags=['one']) == ['a']
+
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index['a']['tags'] == ['one']
+        assert TemplateManager(templates_dir=tmp_path)._index == index
+
+    def test_mtime_change_invalidates_entry(self, tmp_path, manager):
+        """An edit that keeps the file size is picked up by its mtime."""
+        path = _write_template(tmp_path, 'a', tags=['one'])
+        assert manager.list_templates(include_builtin=False, tags=['one']) == ['a']
+
+        size = path.stat().st_size
+        path.write_text(path.read_text().replace('"one"', '"two"'))
+        assert path.stat().st_size == size
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        assert manager.list_templates(include_builtin=False, tags=['one']) == []
+        assert manager.list_templates(include_builtin=False, tags=['two']) == ['a']
+
+    def test_size_change_invalidates_entry(self, tmp_path, manager):
+        """An edit that keeps the mtime is picked up by its size."""
+        path = _write_template(tmp_path, 'a', tags=['one'])
+        assert manager.list_templates(include_builtin=False, tags=['one']) == ['a']
+
+        st = path.stat()
+        path.write_text(path.read_text().replace('"one"', '"three"'))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert path.stat().st_mtime_ns == st.st_mtime_ns
+
+        assert manager.list_templates(include_builtin=False, tags=['one']) == []
+        assert manager.list_templates(include_builtin=False, tags=['three']) == ['a']
+
+        # The refreshed entry is written back
+        index = json.loads((tmp_path / INDEX_FILENAME).read_text())
+        assert index['a']['tags'] == ['three']
+
+    def test_damaged_index_is_rebuilt(self, tmp_path):
+        """An unreadable index file is ignored and rebuilt from the templates."""
+        _write_template(tmp_path, 'a', tags=['one'])
+        (tmp_path / INDEX_FILENAME).write_text('{not json')
+
+        manager = TemplateManager(templates_dir=tmp_path)
+        assert manager.list_templates(include_builtin=False, tags=['one']) == ['a']
+        assert json.loads((tmp_path / INDEX_FILENAME).read_text())['a']['tags'] == ['one']
+
+
+class TestInheritance:
+    """Tests for resolving parent templates."""
+
+    def test_parent_is_merged(self, tmp_path, manager):
+        """A child template is merged with its parent."""
+        _write_template(tmp_path, 'base', tags=['base'])
+        _write_template(tmp_path, 'child', parent='base', tags=['child'])
+
+        template = manager.load('child')
+
+        assert template.name == 'child'
+        assert set(template.tags) >= {'base', 'child'}
+
+    def test_cycle_raises(self, tmp_path, manager):
+        """A -> B -> A raises a ValidationError naming the cycle."""
+        _write_template(tmp_path, 'a', parent='b')
+        _write_template(tmp_path, 'b', parent='a')
+
+        with pytest.raises(ValidationError, match=r"Inheritance cycle: a -> b -> a"):
+            manager.load('a')
+
+        with pytest.raises(ValidationError, match=r"Inheritance cycle: b -> a -> b"):
+            manager.load('b')
+
+    def test_longer_cycle_raises(self, tmp_path, manager):
+        """A cycle below the requested template is reported too."""
+        _write_template(tmp_path, 'top', parent='a')
+        _write_template(tmp_path, 'a', parent='b')
+        _write_template(tmp_path, 'b', parent='c')
+        _write_template(tmp_path, 'c', parent='a')
+
+        with pytest.raises(ValidationError, match=r"Inheritance cycle: top -> a -> b -> c -> a"):
+            manager.load('top')
+
+    def test_missing_parent_raises(self, tmp_path, manager):
+        """A parent that does not exist raises a ValidationError."""
+        _write_template(tmp_path, 'orphan', parent='missing')
+
+        with pytest.raises(ValidationError, match="'missing' not found"):
+            manager.load('orphan')
+
+
+class TestCopyTemplate:
+    """Tests for copy_template."""
+
+    def test_parentless_copy_skips_load_and_clone(self, tmp_path, manager, monkeypatch):
+        """A template without a parent is copied as JSON, changing only its name."""
+        _write_template(tmp_path, 'a', tags=['one'])
+        source = json.loads((tmp_path / 'a.json').read_text())
+
+        def fail(*args, **kwargs):
+            raise AssertionError("copy_template built the copy from a loaded template")
+
+        monkeypatch.setattr(TemplateManager, 'load', fail)
+        monkeypatch.setattr(TemplateManager, '_load_unresolved', fail)
+        monkeypatch.setattr(Template, 'clone', fail)
+
+        copied = manager.copy_template('a', 'b')
+
+        saved = json.loads((tmp_path / 'b.json').read_text())
+        metadata = saved.pop('metadata')
+        source_metadata = source.pop('metadata')
+        assert saved == {**source, 'name': 'b'}
+        assert metadata['cloned_from'] == 'a'
+        assert metadata['created_at'] == metadata['updated_at'] >= source_metadata['created_at']
+
+        assert copied.name == 'b'
+        assert copied.to_dict() == Template.from_dict({**saved, 'metadata': metadata}).to_dict()
+        assert manager.list_templates(include_builtin=False, tags=['one']) == ['a', 'b']
+
+    def test_builtin_can_be_copied(self, tmp_path, manager):
+        """A built-in template is copied into the user directory."""
+        name = manager.list_templates()[0]
+
+        manager.copy_template(name, 'mine')
+
+        assert (tmp_path / 'mine.json').exists()
+        assert manager.load('mine').description == manager.load(name).description
+
+    def test_copy_is_saved_under_new_name(self, tmp_path, manager):
+        """The copy is validated, saved and loadable; the source is unchanged."""
+        _write_template(tmp_path, 'a', tags=['one'])
+
+        copied = manager.copy_template('a', 'b')
+
+        assert copied.name == 'b'
+        assert manager.load('b').tags == ['one']
+        assert manager.load('a').name == 'a'
+        with pytest.raises(FileExistsError):
+            manager.copy_template('a', 'b')
+
+    def test_copy_of_child_is_merged(self, tmp_path, manager):
+        """A template with a parent is copied merged with it."""
+        _write_template(tmp_path, 'base', tags=['base'])
+        _write_template(tmp_path, 'child', parent='base', tags=['child'])
+
+        manager.copy_template('child', 'copy')
+
+        saved = json.loads((tmp_path / 'copy.json').read_text())
+        assert set(saved['tags']) >= {'base', 'child'}
+
+    def test_invalid_name_is_rejected(self, tmp_path, manager):
+        """The new name is validated before anything is written."""
+        _write_template(tmp_path, 'a')
+
+        with pytest.raises(ValidationError):
+            manager.copy_template('a', 'bad name')
+        assert sorted(p.name for p in tmp_path.glob('*.json')) == ['a.json']
+
+
+class TestStr:
+    """Tests for the manager's string representation."""
+
+    def test_counts_template_files_only(self, tmp_path, manager):
+        """The user count skips the index file, other files and directories."""
+        _write_template(tmp_path, 'a', tags=['one'])
+        _write_template(tmp_path, 'b')
+        manager.list_templates(include_builtin=False, tags=['one'])
+        assert (tmp_path / INDEX_FILENAME).exists()
+        (tmp_path / 'notes.txt').write_text('not a template')
+        (tmp_path / 'folder.json').mkdir()
+
+        builtin_count = len(manager.list_templates()) - 2
+        assert str(manager) == (
+            f"TemplateManager(user_templates=2, builtin_templates={builtin_count}, cached=0)"
+        )